@@ -0,0 +1,83 @@
+"""Command line tools for the Roboflow Uploader (requires the ``cli`` extra)."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import typer
+
+from app.core.config import load_config
+from app.core.event_index import EventIndex, iter_time_range
+
+app = typer.Typer(help="Roboflow Uploader command line tools.")
+events_app = typer.Typer(help="Query logs/events.jsonl and its rotated segments.")
+app.add_typer(events_app, name="events")
+
+LogsDirOption = typer.Option(None, "--logs-dir", help="Defaults to the application's logs/ directory.")
+
+
+def _logs_dir(logs_dir: Optional[Path]) -> Path:
+    return logs_dir or load_config().logs_dir
+
+
+def _print(events: Iterable[Dict[str, Any]]) -> None:
+    for event in events:
+        typer.echo(json.dumps(event, ensure_ascii=False))
+
+
+@events_app.command("range")
+def events_range(
+    since: Optional[str] = typer.Option(None, help="ISO-8601 start time (UTC if naive)."),
+    until: Optional[str] = typer.Option(None, help="ISO-8601 end time (UTC if naive)."),
+    event: Optional[str] = typer.Option(None, help="Only events with this name."),
+    logs_dir: Optional[Path] = LogsDirOption,
+) -> None:
+    """Print events between two timestamps."""
+
+    matches = iter_time_range(_logs_dir(logs_dir), since, until)
+    _print(e for e in matches if event is None or e.get("event") == event)
+
+
+@events_app.command("op")
+def events_for_operation(
+    operation_id: str,
+    logs_dir: Optional[Path] = LogsDirOption,
+) -> None:
+    """Print every event of one operation, e.g. ext-20261015-101500-000000."""
+
+    with EventIndex(_logs_dir(logs_dir)) as index:
+        index.update()
+        _print(index.by_operation(operation_id))
+
+
+@events_app.command("name")
+def events_by_name(
+    event: str,
+    since: Optional[str] = typer.Option(None, help="ISO-8601 start time (UTC if naive)."),
+    until: Optional[str] = typer.Option(None, help="ISO-8601 end time (UTC if naive)."),
+    limit: Optional[int] = typer.Option(None, help="Stop after this many events."),
+    logs_dir: Optional[Path] = LogsDirOption,
+) -> None:
+    """Print events with a given name through the sidecar index."""
+
+    with EventIndex(_logs_dir(logs_dir)) as index:
+        index.update()
+        _print(index.by_event(event, since, until, limit=limit))
+
+
+@events_app.command("reindex")
+def events_reindex(logs_dir: Optional[Path] = LogsDirOption) -> None:
+    """Bring the sidecar index up to date."""
+
+    with EventIndex(_logs_dir(logs_dir)) as index:
+        added = index.update()
+    typer.echo(f"{added} events indexed")
+
+
+def main() -> None:
+    app()
+
+
+if __name__ == "__main__":
+    main()
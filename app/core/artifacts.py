@@ -0,0 +1,447 @@
+"""Content-addressed storage for model artifacts.
+
+Objects live under ``<root>/sha256/<ab>/<digest>``. A new file is copied
+into a temporary file under the store and hashed in the same pass, then
+renamed to its object path, or discarded if that object already exists.
+Only when the :class:`HashCache` already knows the digest and the object is
+stored does linking read and copy nothing.
+
+Copies use the fastest primitive the platform offers, falling back in
+order: ``FICLONE`` reflink (btrfs, XFS), ``copy_file_range``, ``sendfile``
+and a buffered userspace copy that hashes while it copies. Kernel
+strategies never move the data through Python, so their digest is taken in
+one read pass over the freshly written (usually still cached) copy.
+
+Digests are plain SHA-256 by default. The optional tree hash splits the file
+into fixed-size chunks, hashes them in parallel and hashes the concatenated
+chunk digests into a root; its objects live under their own algorithm
+directory since the two digests of one file differ. A tree digest is always
+taken from the finished copy so the chunks can be hashed in parallel.
+"""
+from __future__ import annotations
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Sequence, Tuple
+
+from .hash_cache import HashCache, file_key
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+COPY_BUFFER_SIZE = 1024 * 1024
+KERNEL_COPY_CHUNK = 64 * 1024 * 1024
+FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+HASH_ALGORITHM = "sha256"
+TREE_HASH_CHUNK_SIZE = 16 * 1024 * 1024
+TREE_HASH_ALGORITHM = f"sha256-tree-{TREE_HASH_CHUNK_SIZE >> 20}m"
+CATALOG_NAME = "catalog.json"
+
+# errnos meaning "this primitive does not work for these files", as opposed
+# to real I/O failures which are raised.
+_UNSUPPORTED_ERRNOS = frozenset(
+    {
+        errno.EXDEV,
+        errno.ENOSYS,
+        errno.EOPNOTSUPP,
+        errno.ENOTTY,
+        errno.EINVAL,
+        errno.EBADF,
+        errno.EPERM,
+        errno.ENOTSOCK,  # sendfile to a regular file outside Linux
+    }
+)
+
+
+@dataclass
+class StoredArtifact:
+    """Outcome of :meth:`ArtifactStore.put`.
+
+    ``strategy`` is ``"dedup"`` when a cached digest showed the object
+    already existed and nothing was read or copied, and
+    ``"dedup_after_copy"`` when the file had to be copied and hashed (no
+    cached digest) before the existing object was found and the copy
+    discarded. ``seconds`` covers the copy primitive only (``0`` when
+    nothing was copied). ``hash_source`` is ``"cache"`` when the digest came
+    from the :class:`HashCache` instead of reading the file; ``stale_cache``
+    flags a cached digest that a paranoid re-hash contradicted.
+    """
+
+    algorithm: str
+    digest: str
+    size_bytes: int
+    path: Path
+    strategy: str
+    seconds: float
+    hash_source: str = "computed"
+    stale_cache: bool = False
+
+    def metadata(self) -> Dict[str, Any]:
+        copied = self.strategy != "dedup" and self.seconds > 0
+        throughput = self.size_bytes / self.seconds / (1024 * 1024) if copied else None
+        return {
+            "strategy": self.strategy,
+            "seconds": round(self.seconds, 4),
+            "throughput_mib_s": round(throughput, 1) if throughput is not None else None,
+            "hash_source": self.hash_source,
+        }
+
+    def checksum(self) -> Dict[str, Any]:
+        """Digest fields for the artifact metadata.
+
+        A plain digest keeps the historical ``sha256`` key; a tree digest is
+        described with its chunk size so it can be recomputed elsewhere.
+        """
+
+        if self.algorithm == HASH_ALGORITHM:
+            return {"sha256": self.digest}
+        return {
+            "tree_hash": {
+                "algorithm": self.algorithm,
+                "chunk_size": TREE_HASH_CHUNK_SIZE,
+                "digest": self.digest,
+            }
+        }
+
+
+def _short_copy(name: str, copied: int, size: int) -> None:
+    # Some filesystems report end of data early (e.g. procfs, FUSE); treat
+    # it as unsupported so the next strategy redoes the copy.
+    raise OSError(errno.EOPNOTSUPP, f"{name} stopped after {copied} of {size} bytes")
+
+
+def _reflink(src: BinaryIO, dst: BinaryIO, size: int) -> None:
+    if fcntl is None:
+        raise OSError(errno.ENOSYS, "FICLONE unavailable")
+    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def _copy_file_range(src: BinaryIO, dst: BinaryIO, size: int) -> None:
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOSYS, "copy_file_range unavailable")
+    copied = 0
+    while copied < size:
+        sent = os.copy_file_range(src.fileno(), dst.fileno(), min(KERNEL_COPY_CHUNK, size - copied))
+        if sent == 0:
+            _short_copy("copy_file_range", copied, size)
+        copied += sent
+
+
+def _sendfile(src: BinaryIO, dst: BinaryIO, size: int) -> None:
+    if not hasattr(os, "sendfile"):
+        raise OSError(errno.ENOSYS, "sendfile unavailable")
+    copied = 0
+    while copied < size:
+        sent = os.sendfile(dst.fileno(), src.fileno(), copied, min(KERNEL_COPY_CHUNK, size - copied))
+        if sent == 0:
+            _short_copy("sendfile", copied, size)
+        copied += sent
+
+
+KERNEL_STRATEGIES = (
+    ("reflink", _reflink),
+    ("copy_file_range", _copy_file_range),
+    ("sendfile", _sendfile),
+)
+
+
+def hash_file(path: Path, *, buffer_size: int = COPY_BUFFER_SIZE) -> str:
+    """Return the SHA-256 of ``path``, read through one reusable buffer."""
+
+    digest = hashlib.sha256()
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with path.open("rb") as fh:
+        while True:
+            read = fh.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def _hash_range(path: Path, offset: int, length: int, buffer_size: int) -> bytes:
+    digest = hashlib.sha256()
+    buffer = bytearray(min(buffer_size, length) or 1)
+    view = memoryview(buffer)
+    with path.open("rb") as fh:
+        fh.seek(offset)
+        remaining = length
+        while remaining:
+            read = fh.readinto(view[: min(len(buffer), remaining)])
+            if not read:
+                break
+            digest.update(view[:read])
+            remaining -= read
+    return digest.digest()
+
+
+def tree_hash_file(
+    path: Path,
+    *,
+    chunk_size: int = TREE_HASH_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    buffer_size: int = COPY_BUFFER_SIZE,
+) -> str:
+    """Return the chunked SHA-256 tree digest of ``path``.
+
+    Each ``chunk_size`` slice is hashed on its own worker thread with its own
+    file handle; hashlib and file reads release the GIL, so throughput
+    scales with cores until the disk saturates. The root is the SHA-256 of
+    the leaf digests concatenated in file order. An empty file has a single
+    empty leaf.
+    """
+
+    size = path.stat().st_size
+    offsets = range(0, size, chunk_size) if size else [0]
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count(), thread_name_prefix="rf-hash") as pool:
+        leaves = pool.map(
+            lambda offset: _hash_range(path, offset, min(chunk_size, size - offset), buffer_size),
+            offsets,
+        )
+        return hashlib.sha256(b"".join(leaves)).hexdigest()
+
+
+def _buffered_copy(src: BinaryIO, dst: BinaryIO, buffer_size: int, digest: Any = None) -> None:
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    while True:
+        read = src.readinto(buffer)
+        if not read:
+            break
+        chunk = view[:read]
+        if digest is not None:
+            digest.update(chunk)
+        dst.write(chunk)
+
+
+def _copy(
+    source: Path,
+    destination: Path,
+    buffer_size: int,
+    kernel_copy: bool,
+    digest: Any = None,
+) -> Tuple[str, float]:
+    size = source.stat().st_size
+    strategy = "buffered"
+    started = time.perf_counter()
+    with source.open("rb") as src, destination.open("wb") as dst:
+        if kernel_copy and sys.platform == "linux":
+            for name, copy in KERNEL_STRATEGIES:
+                try:
+                    copy(src, dst, size)
+                except OSError as exc:
+                    if exc.errno not in _UNSUPPORTED_ERRNOS:
+                        raise
+                    src.seek(0)
+                    dst.seek(0)
+                    dst.truncate()
+                    continue
+                strategy = name
+                break
+        if strategy == "buffered":
+            _buffered_copy(src, dst, buffer_size, digest)
+    seconds = time.perf_counter() - started
+    shutil.copystat(source, destination)
+    return strategy, seconds
+
+
+def copy_file(
+    source: Path,
+    destination: Path,
+    *,
+    buffer_size: int = COPY_BUFFER_SIZE,
+    kernel_copy: bool = True,
+) -> str:
+    """Copy ``source`` to ``destination`` and return the strategy that worked.
+
+    The kernel primitives are only tried on Linux. A strategy that reports
+    itself unsupported, or stops short of the source size, leaves the
+    destination truncated and the next one is tried. Metadata is copied
+    like :func:`shutil.copy2`.
+    """
+
+    return _copy(source, destination, buffer_size, kernel_copy)[0]
+
+
+def copy_and_hash(
+    source: Path,
+    destination: Path,
+    *,
+    algorithm: str = HASH_ALGORITHM,
+    buffer_size: int = COPY_BUFFER_SIZE,
+    kernel_copy: bool = True,
+) -> Tuple[str, str]:
+    """Copy like :func:`copy_file` and return ``(strategy, digest)``.
+
+    For plain SHA-256 the buffered copy feeds every chunk to the hash as it
+    is written, so the source is read once. Otherwise the digest is taken
+    from ``destination``, i.e. from the bytes that were actually stored:
+    after a kernel copy, and always for the tree hash so its chunks are
+    hashed in parallel by :func:`tree_hash_file`.
+    """
+
+    strategy, digest, _ = _copy_and_hash(source, destination, algorithm, buffer_size, kernel_copy)
+    return strategy, digest
+
+
+def _copy_and_hash(
+    source: Path,
+    destination: Path,
+    algorithm: str,
+    buffer_size: int,
+    kernel_copy: bool,
+) -> Tuple[str, str, float]:
+    if algorithm != HASH_ALGORITHM:
+        strategy, seconds = _copy(source, destination, buffer_size, kernel_copy)
+        return strategy, tree_hash_file(destination), seconds
+    digest = hashlib.sha256()
+    strategy, seconds = _copy(source, destination, buffer_size, kernel_copy, digest)
+    if strategy == "buffered":
+        return strategy, digest.hexdigest(), seconds
+    return strategy, hash_file(destination), seconds
+
+
+class ArtifactStore:
+    """Content-addressed artifact directory with a name catalog.
+
+    ``catalog.json`` maps each linked file name to the digest it pointed to
+    last, so two different ``best.pt`` files no longer overwrite each other
+    and a name can still be resolved to its current object. Objects are
+    written to a temporary file in ``root`` (same filesystem) and renamed
+    into place, so readers never see a partial object. ``hash_algorithm`` is
+    either :data:`HASH_ALGORITHM` or :data:`TREE_HASH_ALGORITHM`.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        kernel_copy: bool = True,
+        hash_cache: Optional[HashCache] = None,
+        hash_algorithm: str = HASH_ALGORITHM,
+    ) -> None:
+        if hash_algorithm not in (HASH_ALGORITHM, TREE_HASH_ALGORITHM):
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}")
+        self.root = root
+        self.hash_algorithm = hash_algorithm
+        self.kernel_copy = kernel_copy
+        self.hash_cache = hash_cache
+        self.catalog_path = root / CATALOG_NAME
+        self._lock = threading.Lock()
+
+    def object_path(self, digest: str, algorithm: Optional[str] = None) -> Path:
+        return self.root / (algorithm or self.hash_algorithm) / digest[:2] / digest
+
+    def put(
+        self,
+        source: Path,
+        *,
+        name: Optional[str] = None,
+        aliases: Sequence[str] = (),
+    ) -> StoredArtifact:
+        """Store ``source`` (if its content is new) and catalog it under ``name``.
+
+        ``aliases`` are further names catalogued for the same object.
+        """
+
+        before = source.stat()
+        seconds = 0.0
+        algorithm = self.hash_algorithm
+        cache = self.hash_cache
+        digest = cache.lookup(before, algorithm) if cache is not None else None
+        hash_source, stale = "cache", False
+        if digest is not None and self.object_path(digest).exists():
+            strategy = "dedup"
+        else:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            os.close(fd)
+            tmp = Path(tmp_name)
+            try:
+                if digest is None:
+                    strategy, digest, seconds = _copy_and_hash(
+                        source, tmp, algorithm, COPY_BUFFER_SIZE, self.kernel_copy
+                    )
+                    hash_source = "computed"
+                else:
+                    strategy, seconds = _copy(source, tmp, COPY_BUFFER_SIZE, self.kernel_copy)
+                after = source.stat()
+                if (after.st_size, after.st_mtime_ns) != (before.st_size, before.st_mtime_ns):
+                    raise OSError(errno.EAGAIN, f"{source} changed while it was being stored")
+                if tmp.stat().st_size != before.st_size:
+                    raise OSError(errno.EIO, f"Short copy of {source}")
+                target = self.object_path(digest)
+                if target.exists():
+                    strategy = "dedup_after_copy"
+                    tmp.unlink()
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(tmp, target)
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+            if cache is not None and hash_source == "computed":
+                stale = not cache.verify(before, algorithm, digest)
+                if file_key(after) == file_key(before):
+                    cache.store(before, algorithm, digest)
+        stored = StoredArtifact(
+            algorithm=algorithm,
+            digest=digest,
+            size_bytes=before.st_size,
+            path=self.object_path(digest),
+            strategy=strategy,
+            seconds=seconds,
+            hash_source=hash_source,
+            stale_cache=stale,
+        )
+        self._catalog([name or source.name, *aliases], stored)
+        return stored
+
+    def resolve(self, name: str) -> Optional[Path]:
+        """Return the object currently catalogued under ``name``, if any."""
+
+        entry = self._read_catalog().get(name)
+        if not entry:
+            return None
+        return self.object_path(entry["digest"], entry.get("algorithm", HASH_ALGORITHM))
+
+    def _read_catalog(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            return json.loads(self.catalog_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _catalog(self, names: Sequence[str], stored: StoredArtifact) -> None:
+        with self._lock:
+            catalog = self._read_catalog()
+            updated_at = datetime.now(timezone.utc).isoformat()
+            for name in names:
+                catalog[name] = {
+                    "algorithm": stored.algorithm,
+                    "digest": stored.digest,
+                    "size_bytes": stored.size_bytes,
+                    "updated_at": updated_at,
+                }
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(catalog, fh, indent=2, ensure_ascii=False)
+                os.replace(tmp_name, self.catalog_path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
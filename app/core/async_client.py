@@ -0,0 +1,249 @@
+"""asyncio-native Roboflow API client."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+try:  # Optional dependency: pip install roboflow-uploader[async]
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None
+
+from .logging_util import log_event
+from .multipart import MultipartFileStream, ProgressCallback
+from .roboflow_client import (
+    API_BASE_URL,
+    DATASET_UPLOAD_PATH,
+    REQUEST_TIMEOUT,
+    RoboflowAPIError,
+    api_error_from_response,
+    parse_projects,
+    parse_versions,
+    parse_workspaces,
+)
+
+MAX_CONCURRENCY = 64
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+
+logger = logging.getLogger("roboflow_uploader.async_client")
+
+
+class AsyncRoboflowClient:
+    """Async counterpart of :class:`RoboflowClient` built on ``httpx``.
+
+    All calls share one ``httpx.AsyncClient`` connection pool and at most
+    ``max_concurrency`` requests are in flight at once; further callers wait
+    on a semaphore instead of opening more sockets. Errors are raised as
+    :class:`RoboflowAPIError` with the same messages as the blocking client.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        *,
+        max_concurrency: int = MAX_CONCURRENCY,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        base_url: Optional[str] = None,
+    ) -> None:
+        if httpx is None:
+            raise RuntimeError(
+                "AsyncRoboflowClient requires httpx; install roboflow-uploader[async]"
+            )
+        self.api_key = api_key
+        self.base_url = (base_url or API_BASE_URL).rstrip("/")
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def __aenter__(self) -> "AsyncRoboflowClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections. The client may be reused afterwards."""
+
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    # ------------------------------------------------------------------
+    # Listing helpers
+    # ------------------------------------------------------------------
+    async def list_workspaces(self) -> List[Dict[str, Any]]:
+        """Return available workspaces for the authenticated user."""
+
+        if not self.api_key:
+            return []
+        response = await self._request("GET", "/")
+        workspaces = parse_workspaces(response.json())
+        log_event(logger, "rf_list_workspaces", count=len(workspaces))
+        return workspaces
+
+    async def list_projects(self, workspace: str) -> List[Dict[str, Any]]:
+        """List projects for a given workspace."""
+
+        if not self.api_key:
+            return []
+        response = await self._request("GET", f"/{workspace}")
+        projects = parse_projects(response.json())
+        log_event(logger, "rf_list_projects", workspace=workspace, count=len(projects))
+        return projects
+
+    async def list_versions(self, workspace: str, project: str) -> List[Dict[str, Any]]:
+        """List versions for a specific project."""
+
+        if not self.api_key:
+            return []
+        response = await self._request("GET", f"/{workspace}/{project}")
+        versions = parse_versions(response.json())
+        log_event(
+            logger,
+            "rf_list_versions",
+            workspace=workspace,
+            project=project,
+            count=len(versions),
+        )
+        return versions
+
+    # ------------------------------------------------------------------
+    # Metadata helpers
+    # ------------------------------------------------------------------
+    async def append_version_note(
+        self,
+        workspace: str,
+        project: str,
+        version: str,
+        note: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Append a note/metadata blob to a version."""
+
+        if not self.api_key:
+            raise RoboflowAPIError(401, "Missing API key")
+
+        payload = {"note": note, "metadata": metadata or {}}
+        response = await self._request(
+            "POST",
+            f"/{workspace}/{project}/{version}/notes",
+            json=payload,
+        )
+        result = response.json()
+        log_event(
+            logger,
+            "rf_append_note",
+            workspace=workspace,
+            project=project,
+            version=version,
+            metadata_keys=list(payload["metadata"].keys()),
+        )
+        return result
+
+    # ------------------------------------------------------------------
+    # Dataset upload / training
+    # ------------------------------------------------------------------
+    async def upload_dataset(
+        self,
+        workspace: str,
+        project: str,
+        dataset_zip_path: str,
+        *,
+        description: str = "",
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """Upload a dataset archive and create a new version.
+
+        Disk reads happen in a worker thread, one chunk at a time, so the
+        event loop never blocks and memory use stays flat.
+        """
+
+        if not self.api_key:
+            raise RoboflowAPIError(401, "Missing API key")
+
+        archive = Path(dataset_zip_path)
+        body = MultipartFileStream(
+            archive,
+            fields={"description": description},
+            content_type="application/zip",
+            progress=progress,
+        )
+
+        async def stream() -> AsyncIterator[bytes]:
+            while True:
+                piece = await asyncio.to_thread(body.read, body.chunk_size)
+                if not piece:
+                    return
+                yield piece
+
+        started = time.perf_counter()
+        try:
+            response = await self._request(
+                "POST",
+                DATASET_UPLOAD_PATH.format(workspace=workspace, project=project),
+                content=stream(),
+                headers={"Content-Type": body.content_type, "Content-Length": str(len(body))},
+            )
+        finally:
+            body.close()
+        result = response.json()
+        log_event(
+            logger,
+            "rf_upload_dataset",
+            workspace=workspace,
+            project=project,
+            archive=archive.name,
+            size_bytes=len(body),
+            seconds=round(time.perf_counter() - started, 3),
+            version=result.get("version"),
+        )
+        return result
+
+    async def trigger_training(self, workspace: str, project: str, version: str) -> Dict[str, Any]:
+        """Trigger a training job for a given dataset version."""
+
+        raise NotImplementedError("Training trigger is not implemented in this template")
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _get_client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=self._limits,
+                timeout=REQUEST_TIMEOUT,
+            )
+        return self._client
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> "httpx.Response":
+        if not self.api_key:
+            raise RoboflowAPIError(401, "Missing API key")
+
+        params = kwargs.pop("params", {})
+        params.setdefault("api_key", self.api_key)
+        async with self._semaphore:
+            try:
+                response = await self._get_client().request(
+                    method,
+                    path,
+                    params=params,
+                    **kwargs,
+                )
+            except httpx.HTTPError as exc:
+                raise RoboflowAPIError(0, f"Network error: {exc}") from exc
+
+        if not response.is_success:
+            raise api_error_from_response(response, self.api_key)
+        return response
@@ -0,0 +1,156 @@
+"""Caches for Roboflow listing responses."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+DEFAULT_LEVEL_TTLS: Dict[str, float] = {
+    "workspaces": 3600.0,
+    "projects": 900.0,
+    "versions": 300.0,
+}
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+RESPONSE_CACHE_TTL = 60.0
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body plus its validators."""
+
+    data: Any
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class HierarchyDiskCache:
+    """JSON-file cache for workspace/project/version listings.
+
+    Entries live under ``<cache_dir>/hierarchy/<account>/<level>/`` where
+    ``account`` is derived from the API key, so switching keys never serves
+    another account's tree. Each entry stores the ETag/Last-Modified headers
+    so an expired entry can be revalidated with a conditional GET.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        api_key: Optional[str],
+        *,
+        ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        account = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+        self.root = cache_dir / "hierarchy" / account
+        self.ttls = {**DEFAULT_LEVEL_TTLS, **(ttls or {})}
+
+    def get(self, level: str, path: str) -> Optional[CacheEntry]:
+        """Return the stored entry regardless of age, or ``None``."""
+
+        try:
+            raw = json.loads(self._entry_path(level, path).read_text(encoding="utf-8"))
+            raw.pop("path", None)
+            return CacheEntry(**raw)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def put(self, level: str, path: str, entry: CacheEntry) -> None:
+        """Atomically write ``entry`` for ``path``."""
+
+        target = self._entry_path(level, path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"path": path, **asdict(entry)}, fh, ensure_ascii=False)
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def touch(self, level: str, path: str, entry: CacheEntry) -> None:
+        """Mark ``entry`` as freshly validated (e.g. after a 304)."""
+
+        entry.fetched_at = time.time()
+        self.put(level, path, entry)
+
+    def invalidate(self, level: str, path: str) -> None:
+        self._entry_path(level, path).unlink(missing_ok=True)
+
+    def is_fresh(self, level: str, entry: CacheEntry) -> bool:
+        return entry.age() < self.ttls.get(level, 0.0)
+
+    def _entry_path(self, level: str, path: str) -> Path:
+        digest = hashlib.sha1(path.encode("utf-8")).hexdigest()
+        return self.root / level / f"{digest}.json"
+
+
+class ResponseCache:
+    """Thread-safe in-memory LRU cache with a per-entry TTL.
+
+    Keys are ``(path, params)`` tuples so entries can be dropped by API path
+    with :meth:`invalidate_path`. ``hits`` and ``misses`` count lookups.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        ttl: float = RESPONSE_CACHE_TTL,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, Hashable]:
+        return path, tuple(sorted((params or {}).items()))
+
+    def get(self, key: Tuple[str, Hashable]) -> Optional[Any]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and time.monotonic() < item[0]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            if item is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Tuple[str, Hashable], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_path(self, path: str) -> int:
+        """Drop every entry for ``path``, whatever its query parameters."""
+
+        with self._lock:
+            doomed = [key for key in self._entries if key[0] == path]
+            for key in doomed:
+                del self._entries[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -0,0 +1,109 @@
+"""Circuit breaker guarding calls to the Roboflow API."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from .logging_util import log_event
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+logger = logging.getLogger("roboflow_uploader.circuit")
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    :meth:`allow_request` returns ``False`` for ``reset_timeout`` seconds.
+    The next caller after that becomes the single half-open probe: success
+    closes the circuit, failure re-opens it for another ``reset_timeout``.
+    State changes are reported as ``rf_circuit_state`` events.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit admits a probe."""
+
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            previous = self._state
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == HALF_OPEN:
+                if self._probe_in_flight:
+                    allowed = False
+                else:
+                    self._probe_in_flight = True
+                    allowed = True
+            else:
+                allowed = True
+            current, failures = self._state, self._failures
+        self._report(previous, current, failures)
+        return allowed
+
+    def release_probe(self) -> None:
+        """Give up a half-open probe reservation without recording an outcome."""
+
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            previous = self._state
+            self._failures = 0
+            self._probe_in_flight = False
+            self._state = CLOSED
+        self._report(previous, CLOSED, 0)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            previous = self._state
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+            current, failures = self._state, self._failures
+        self._report(previous, current, failures)
+
+    def _report(self, previous: str, current: str, failures: int) -> None:
+        if previous == current:
+            return
+        log_event(
+            logger,
+            "rf_circuit_state",
+            breaker=self.name,
+            previous=previous,
+            state=current,
+            consecutive_failures=failures,
+        )
@@ -18,10 +18,12 @@ class AppConfig:
 
     api_key: Optional[str]
     app_env: str
+    api_base_url: Optional[str]
     base_dir: Path
     logs_dir: Path
     manifests_dir: Path
     artifacts_dir: Path
+    cache_dir: Path
 
 
 def load_config() -> AppConfig:
@@ -32,21 +34,25 @@ def load_config() -> AppConfig:
 
     api_key = os.getenv("ROBOFLOW_API_KEY")
     app_env = os.getenv("APP_ENV", "dev")
+    api_base_url = os.getenv("ROBOFLOW_API_URL") or None
 
     logs_dir = base_dir / "logs"
     manifests_dir = base_dir / "outputs" / "manifests"
     artifacts_dir = base_dir / "outputs" / "artifacts"
+    cache_dir = base_dir / "cache"
 
-    for path in (logs_dir, manifests_dir, artifacts_dir):
+    for path in (logs_dir, manifests_dir, artifacts_dir, cache_dir):
         path.mkdir(parents=True, exist_ok=True)
 
     return AppConfig(
         api_key=api_key,
         app_env=app_env,
+        api_base_url=api_base_url,
         base_dir=base_dir,
         logs_dir=logs_dir,
         manifests_dir=manifests_dir,
         artifacts_dir=artifacts_dir,
+        cache_dir=cache_dir,
     )
 
 
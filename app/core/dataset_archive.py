@@ -0,0 +1,131 @@
+"""Helpers for reading dataset archives without extracting them."""
+from __future__ import annotations
+
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Optional, Tuple
+
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".webp", ".tif", ".tiff"})
+ANNOTATION_EXTENSIONS = frozenset({".txt", ".xml", ".json"})
+SPLIT_ALIASES = {"train": "train", "valid": "valid", "val": "valid", "test": "test"}
+
+
+@dataclass(frozen=True)
+class DatasetItem:
+    """One image in an archive and its paired annotation member, if any."""
+
+    image: str
+    annotation: Optional[str]
+    split: Optional[str]
+    size_bytes: int
+    crc32: int = 0
+    annotation_crc32: Optional[int] = None
+
+
+def _split_of(parts: Tuple[str, ...]) -> Optional[str]:
+    for part in parts:
+        split = SPLIT_ALIASES.get(part.lower())
+        if split:
+            return split
+    return None
+
+
+def scan_archive(archive: zipfile.ZipFile) -> List[DatasetItem]:
+    """List the images in ``archive`` paired with their annotations.
+
+    Only the central directory is read. An annotation pairs with an image
+    when both share the file stem and split, which covers YOLO
+    (``train/images/a.jpg`` + ``train/labels/a.txt``) and VOC (``a.jpg`` +
+    ``a.xml`` side by side) layouts. Items come back in archive order.
+    """
+
+    images = []
+    annotations: Dict[Tuple[Optional[str], str], zipfile.ZipInfo] = {}
+    for info in archive.infolist():
+        if info.is_dir():
+            continue
+        path = PurePosixPath(info.filename)
+        if any(part.startswith(("__MACOSX", ".")) for part in path.parts):
+            continue
+        suffix = path.suffix.lower()
+        split = _split_of(path.parts[:-1])
+        if suffix in IMAGE_EXTENSIONS:
+            images.append((info, split))
+        elif suffix in ANNOTATION_EXTENSIONS:
+            annotations.setdefault((split, path.stem), info)
+
+    items = []
+    for info, split in images:
+        annotation = annotations.get((split, PurePosixPath(info.filename).stem))
+        items.append(
+            DatasetItem(
+                image=info.filename,
+                annotation=annotation.filename if annotation else None,
+                split=split,
+                size_bytes=info.file_size,
+                crc32=info.CRC,
+                annotation_crc32=annotation.CRC if annotation else None,
+            )
+        )
+    return items
+
+
+def build_file_index(items: List[DatasetItem]) -> Dict[str, Dict[str, Any]]:
+    """Map each image member to the CRC32/size fingerprints of it and its labels.
+
+    The values come from the zip central directory, so indexing costs no
+    decompression; the result is stored in the manifest for the next diff.
+    """
+
+    return {
+        item.image: {
+            "crc32": item.crc32,
+            "size_bytes": item.size_bytes,
+            "annotation": item.annotation,
+            "annotation_crc32": item.annotation_crc32,
+        }
+        for item in items
+    }
+
+
+@dataclass
+class DatasetDiff:
+    """Structured difference between two file indexes.
+
+    ``added`` also holds images whose own bytes changed under the same path,
+    since the API treats those as new images.
+    """
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed_label: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "changed_label": len(self.changed_label),
+            "unchanged": len(self.unchanged),
+        }
+
+
+def diff_file_index(
+    previous: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]]
+) -> DatasetDiff:
+    """Compare two :func:`build_file_index` results by key and fingerprint."""
+
+    diff = DatasetDiff(removed=sorted(previous.keys() - current.keys()))
+    for name, entry in current.items():
+        before = previous.get(name)
+        if before is None or (before["crc32"], before["size_bytes"]) != (
+            entry["crc32"],
+            entry["size_bytes"],
+        ):
+            diff.added.append(name)
+        elif before.get("annotation_crc32") != entry["annotation_crc32"]:
+            diff.changed_label.append(name)
+        else:
+            diff.unchanged.append(name)
+    return diff
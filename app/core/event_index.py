@@ -0,0 +1,323 @@
+"""Time-range and indexed lookups over ``events.jsonl`` and its rotated segments."""
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import mmap
+import re
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .log_rotation import COMPRESSION_EXTENSIONS, zstandard
+
+EVENTS_FILE = "events.jsonl"
+INDEX_FILE = "events.index.sqlite3"
+# Lines are written in arrival order while ``ts`` is taken when the record
+# is created, so neighbouring lines can be slightly out of order.
+TS_SKEW = timedelta(seconds=5)
+_TS_PATTERN = re.compile(rb'"ts":\s*"([^"]+)"')
+_ROTATED_AT = re.compile(r"-(\d{8}-\d{6}-\d{6})\.")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    name TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    indexed_bytes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    segment TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    ts TEXT,
+    event TEXT,
+    operation_id TEXT
+);
+CREATE INDEX IF NOT EXISTS events_by_operation ON events (operation_id, ts);
+CREATE INDEX IF NOT EXISTS events_by_name ON events (event, ts);
+CREATE INDEX IF NOT EXISTS events_by_segment ON events (segment);
+"""
+
+
+def normalize_ts(value: str) -> str:
+    """Return ``value`` as the UTC ISO-8601 form used in the log; naive times are UTC."""
+
+    parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def _shift(ts: str, delta: timedelta) -> str:
+    return (datetime.fromisoformat(ts) + delta).isoformat()
+
+
+def _line_ts(line: bytes) -> str:
+    match = _TS_PATTERN.search(line, 0, 256)
+    return match.group(1).decode("ascii", "replace") if match else ""
+
+
+def list_segments(logs_dir: Path, name: str = EVENTS_FILE) -> List[Path]:
+    """Rotated segments oldest first, then the live file."""
+
+    stem, suffix = Path(name).stem, Path(name).suffix
+    rotated = sorted(
+        p for p in logs_dir.glob(f"{stem}-*{suffix}*") if not p.name.endswith(".tmp")
+    )
+    live = logs_dir / name
+    return rotated + ([live] if live.exists() else [])
+
+
+def rotated_at(path: Path) -> Optional[str]:
+    """UTC ISO time a rotated segment was closed, taken from its name."""
+
+    match = _ROTATED_AT.search(path.name)
+    if match is None:
+        return None
+    stamp = datetime.strptime(match.group(1), "%Y%m%d-%H%M%S-%f")
+    return stamp.replace(tzinfo=timezone.utc).isoformat()
+
+
+def _is_compressed(path: Path) -> bool:
+    return path.suffix in COMPRESSION_EXTENSIONS.values()
+
+
+def _open_stream(path: Path) -> BinaryIO:
+    if path.suffix == COMPRESSION_EXTENSIONS["gzip"]:
+        return gzip.open(path, "rb")
+    if path.suffix == COMPRESSION_EXTENSIONS["zstd"]:
+        if zstandard is None:
+            raise RuntimeError(f"{path.name} needs the zstandard package to be read")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(path.open("rb")))
+    return path.open("rb")
+
+
+def _first_at_or_after(view: mmap.mmap, target: str) -> int:
+    """Byte offset of the first line whose ``ts`` is >= ``target``."""
+
+    def line_start(pos: int) -> int:
+        if pos == 0:
+            return 0
+        newline = view.find(b"\n", pos - 1)
+        return len(view) if newline == -1 else newline + 1
+
+    lo, hi = 0, len(view)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = line_start(mid)
+        if start >= len(view) or _line_ts(view[start : start + 256]) >= target:
+            hi = mid
+        else:
+            lo = mid + 1
+    return line_start(lo)
+
+
+def iter_time_range(
+    logs_dir: Path,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    *,
+    name: str = EVENTS_FILE,
+) -> Iterator[Dict[str, Any]]:
+    """Yield events with ``start <= ts <= end`` from every segment, oldest first.
+
+    Uncompressed segments are memory-mapped and binary-searched on ``ts``
+    (allowing :data:`TS_SKEW` for slightly out-of-order lines), so only the
+    matching region is read. Compressed segments are streamed. Segments are
+    skipped by the rotation time in their name: one closed before ``start``
+    holds nothing newer, and once a segment was closed after ``end`` the
+    ones after it start too late.
+    """
+
+    start = normalize_ts(start) if start else ""
+    end = normalize_ts(end) if end else ""
+    low = _shift(start, -TS_SKEW) if start else ""
+    high = _shift(end, TS_SKEW) if end else ""
+    previous_closed = ""
+    for segment in list_segments(logs_dir, name):
+        if high and previous_closed > high:
+            break
+        closed = rotated_at(segment) or ""
+        previous_closed = closed
+        if low and closed and closed < low:
+            continue
+        if _is_compressed(segment):
+            with _open_stream(segment) as fh:
+                yield from _scan(fh, start, end, high)
+            continue
+        with segment.open("rb") as fh:
+            if segment.stat().st_size == 0:
+                continue
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                offset = _first_at_or_after(view, low) if low else 0
+                view.seek(offset)
+                yield from _scan(view, start, end, high)
+
+
+def _scan(lines: Any, start: str, end: str, high: str) -> Iterator[Dict[str, Any]]:
+    for line in iter(lines.readline, b""):
+        if not line.endswith(b"\n"):
+            break
+        ts = _line_ts(line)
+        if high and ts > high:
+            break
+        if ts and (not start or ts >= start) and (not end or ts <= end):
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+class EventIndex:
+    """SQLite sidecar index of events by name and ``operation_id``.
+
+    The index lives next to the log as ``events.index.sqlite3`` and is
+    brought up to date incrementally by :meth:`update`: the live file is
+    indexed from where the last run stopped, segments that appeared since
+    (rotated or freshly compressed) are indexed once, and rows of files
+    that disappeared or were replaced are dropped. Each row stores the
+    line's byte offset (in the decompressed stream for compressed segments)
+    so matches are read back without scanning.
+    """
+
+    def __init__(self, logs_dir: Path, *, name: str = EVENTS_FILE) -> None:
+        self.logs_dir = logs_dir
+        self.name = name
+        self.db_path = logs_dir / INDEX_FILE
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "EventIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def update(self) -> int:
+        """Index new lines and segments; return the number of rows added."""
+
+        present = {path.name: path for path in list_segments(self.logs_dir, self.name)}
+        known = {
+            name: (inode, indexed)
+            for name, inode, indexed in self._conn.execute(
+                "SELECT name, inode, indexed_bytes FROM segments"
+            )
+        }
+        added = 0
+        with self._conn:
+            for gone in known.keys() - present.keys():
+                self._forget(gone)
+            for name, path in present.items():
+                stat = path.stat()
+                inode, indexed = known.get(name, (None, 0))
+                # Compressed segments are immutable and their offsets refer to
+                # the decompressed stream, so only a new inode matters.
+                if inode == stat.st_ino and (_is_compressed(path) or indexed == stat.st_size):
+                    continue
+                if inode != stat.st_ino or indexed > stat.st_size:
+                    self._forget(name)
+                    indexed = 0
+                count, indexed = self._index_segment(path, indexed)
+                added += count
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO segments VALUES (?, ?, ?)", (name, stat.st_ino, indexed)
+                )
+        return added
+
+    def by_operation(self, operation_id: str) -> List[Dict[str, Any]]:
+        return self._fetch(
+            "SELECT segment, offset, length FROM events WHERE operation_id = ? ORDER BY ts",
+            (operation_id,),
+        )
+
+    def by_event(
+        self,
+        event: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        *,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        query = "SELECT segment, offset, length FROM events WHERE event = ?"
+        params: List[Any] = [event]
+        if start:
+            query += " AND ts >= ?"
+            params.append(normalize_ts(start))
+        if end:
+            query += " AND ts <= ?"
+            params.append(normalize_ts(end))
+        query += " ORDER BY ts"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self._fetch(query, params)
+
+    def _forget(self, name: str) -> None:
+        self._conn.execute("DELETE FROM events WHERE segment = ?", (name,))
+        self._conn.execute("DELETE FROM segments WHERE name = ?", (name,))
+
+    def _index_segment(self, path: Path, offset: int) -> Tuple[int, int]:
+        rows = []
+        with _open_stream(path) as fh:
+            if offset:
+                fh.seek(offset)
+            for line in iter(fh.readline, b""):
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if isinstance(record, dict) and ("event" in record or "operation_id" in record):
+                    rows.append(
+                        (
+                            path.name,
+                            offset,
+                            len(line),
+                            record.get("ts"),
+                            record.get("event"),
+                            record.get("operation_id"),
+                        )
+                    )
+                offset += len(line)
+        self._conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows), offset
+
+    def _fetch(self, query: str, params: Sequence[Any]) -> List[Dict[str, Any]]:
+        spans = self._conn.execute(query, params).fetchall()
+        wanted: Dict[str, Set[int]] = {}
+        for segment, offset, _ in spans:
+            wanted.setdefault(segment, set()).add(offset)
+        lines: Dict[Tuple[str, int], bytes] = {}
+        for segment, offsets in wanted.items():
+            path = self.logs_dir / segment
+            if _is_compressed(path):
+                last = max(offsets)
+                with _open_stream(path) as fh:
+                    position = 0
+                    for line in iter(fh.readline, b""):
+                        if position in offsets:
+                            lines[segment, position] = line
+                        position += len(line)
+                        if position > last:
+                            break
+            else:
+                with path.open("rb") as fh:
+                    for offset in sorted(offsets):
+                        fh.seek(offset)
+                        lines[segment, offset] = fh.readline()
+        results = []
+        for segment, offset, _ in spans:
+            line = lines.get((segment, offset))
+            if line:
+                try:
+                    results.append(json.loads(line))
+                except ValueError:
+                    continue
+        return results
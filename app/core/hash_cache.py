@@ -0,0 +1,109 @@
+"""Persistent cache of file digests keyed by file identity."""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+HASH_CACHE_MAX_ENTRIES = 10_000
+# A file modified this recently may change again within the same mtime tick
+# without its stat changing, so its digest is not cached yet.
+RACY_WINDOW_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_hashes (
+    dev INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (dev, inode, size_bytes, mtime_ns, algorithm)
+)
+"""
+
+FileKey = Tuple[int, int, int, int]
+
+
+def file_key(stat: os.stat_result) -> FileKey:
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class HashCache:
+    """Remember digests of files that have not changed since they were hashed.
+
+    A file is identified by ``(device, inode, size, mtime_ns)``; any write
+    that changes the content also changes one of these, so a hit proves the
+    file is unchanged as far as the filesystem can tell. The table keeps at
+    most ``max_entries`` rows and evicts the least recently used. With
+    ``paranoid`` the cache is still written but every lookup misses, so each
+    link re-verifies the file and :meth:`verify` reports stale entries.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_entries: int = HASH_CACHE_MAX_ENTRIES,
+        paranoid: bool = False,
+    ) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.paranoid = paranoid
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def lookup(self, stat: os.stat_result, algorithm: str) -> Optional[str]:
+        if self.paranoid:
+            return None
+        return self._get(file_key(stat), algorithm, touch=True)
+
+    def verify(self, stat: os.stat_result, algorithm: str, digest: str) -> bool:
+        """Return False if a cached digest exists for ``stat`` and differs from ``digest``."""
+
+        cached = self._get(file_key(stat), algorithm, touch=False)
+        return cached is None or cached == digest
+
+    def store(self, stat: os.stat_result, algorithm: str, digest: str) -> None:
+        if time.time_ns() - stat.st_mtime_ns < RACY_WINDOW_NS:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*file_key(stat), algorithm, digest, time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM file_hashes WHERE rowid IN ("
+                "SELECT rowid FROM file_hashes ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _get(self, key: FileKey, algorithm: str, *, touch: bool) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest FROM file_hashes WHERE dev = ? AND inode = ? "
+                "AND size_bytes = ? AND mtime_ns = ? AND algorithm = ?",
+                (*key, algorithm),
+            ).fetchone()
+            if row is not None and touch:
+                self._conn.execute(
+                    "UPDATE file_hashes SET last_used = ? WHERE dev = ? AND inode = ? "
+                    "AND size_bytes = ? AND mtime_ns = ? AND algorithm = ?",
+                    (time.time(), *key, algorithm),
+                )
+                self._conn.commit()
+        return row[0] if row else None
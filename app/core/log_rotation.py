@@ -0,0 +1,156 @@
+"""Size/time based rotation for the application's log files."""
+from __future__ import annotations
+
+import gzip
+import logging
+import logging.handlers
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+try:  # Optional dependency: faster, smaller segments when installed
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None
+
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RotationPolicy:
+    """When to start a new segment and how many old ones to keep.
+
+    A segment rotates once it holds ``max_bytes`` or has been written to for
+    ``max_age`` seconds (``0`` disables either trigger). ``compression`` is
+    ``"auto"`` (zstd when :mod:`zstandard` is installed, gzip otherwise),
+    ``"zstd"``, ``"gzip"`` or ``None``. A ``backup_count`` of ``0`` keeps
+    every segment.
+    """
+
+    max_bytes: int = 50 * 1024 * 1024
+    max_age: float = 24 * 3600.0
+    backup_count: int = 14
+    compression: Optional[str] = "auto"
+
+    def compression_method(self) -> Optional[str]:
+        if self.compression in ("auto", "zstd"):
+            return "zstd" if zstandard is not None else "gzip"
+        return self.compression
+
+
+DEFAULT_ROTATION = RotationPolicy()
+
+
+def _background() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+        return _executor
+
+
+def compress_segment(path: Path, method: str) -> Path:
+    """Compress ``path`` next to itself, remove the original and return the new path."""
+
+    target = path.with_name(path.name + COMPRESSION_EXTENSIONS[method])
+    tmp = target.with_name(target.name + ".tmp")
+    with path.open("rb") as src:
+        if method == "zstd":
+            with tmp.open("wb") as raw, zstandard.ZstdCompressor().stream_writer(raw) as dst:
+                shutil.copyfileobj(src, dst)
+        else:
+            with gzip.open(tmp, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst)
+    os.replace(tmp, target)
+    path.unlink()
+    return target
+
+
+class LogRotator:
+    """Rename a live log file to a timestamped segment and tidy up in the background.
+
+    ``app.log`` becomes ``app-<UTC timestamp>.log`` (then ``.log.gz`` or
+    ``.log.zst``); only the newest ``backup_count`` segments are kept. The
+    rename is the only work done on the logging thread; compression and
+    pruning run on a shared background thread. The age trigger counts from
+    when this process opened the segment.
+    """
+
+    def __init__(self, path: Path, policy: RotationPolicy) -> None:
+        self.path = path
+        self.policy = policy
+        self.segment_started = time.time()
+
+    def should_rotate(self, size: int) -> bool:
+        if size <= 0:
+            return False
+        policy = self.policy
+        if policy.max_bytes and size >= policy.max_bytes:
+            return True
+        return bool(policy.max_age) and time.time() - self.segment_started >= policy.max_age
+
+    def rotate(self) -> None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S-%f")
+        segment = self.path.with_name(f"{self.path.stem}-{stamp}{self.path.suffix}")
+        try:
+            os.replace(self.path, segment)
+        except FileNotFoundError:
+            return
+        finally:
+            self.segment_started = time.time()
+        _background().submit(self._finish, segment)
+
+    def segments(self) -> List[Path]:
+        """Rotated segments of this log, oldest first."""
+
+        pattern = f"{self.path.stem}-*{self.path.suffix}*"
+        return sorted(p for p in self.path.parent.glob(pattern) if not p.name.endswith(".tmp"))
+
+    def _finish(self, segment: Path) -> None:
+        method = self.policy.compression_method()
+        try:
+            if method is not None:
+                compress_segment(segment, method)
+            if self.policy.backup_count:
+                # Segments still waiting for compression are not finished
+                # yet; pruning them would race with their own _finish.
+                finished = [
+                    path
+                    for path in self.segments()
+                    if method is None or path.suffix in COMPRESSION_EXTENSIONS.values()
+                ]
+                for path in finished[: -self.policy.backup_count]:
+                    path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            return  # already pruned or removed by hand
+        except OSError:
+            logging.getLogger(__name__).exception("Could not finish log segment %s", segment)
+
+
+class RotatingLogHandler(logging.handlers.BaseRotatingHandler):
+    """File handler for ``app.log`` that rotates by size or age via :class:`LogRotator`."""
+
+    def __init__(self, filename: Path, policy: RotationPolicy, *, encoding: str = "utf-8") -> None:
+        super().__init__(filename, "a", encoding=encoding)
+        self.rotator = LogRotator(Path(filename), policy)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:  # noqa: N802 - logging API
+        if self.stream is None:
+            return False
+        return self.rotator.should_rotate(self.stream.tell())
+
+    def doRollover(self) -> None:  # noqa: N802 - logging API
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        self.rotator.rotate()
+        self.stream = self._open()
@@ -1,41 +1,244 @@
 """Logging helpers for the Roboflow Uploader."""
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import logging
+import logging.handlers
+import queue
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Optional, TextIO
+
+try:  # Optional dependency: faster JSON encoding for structured events
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
 
 from .config import APP_NAME, APP_VERSION
+from .log_rotation import LogRotator, RotatingLogHandler, RotationPolicy
 
 APP_LOGGER_NAME = "roboflow_uploader"
+EVENTS_FLUSH_BYTES = 64 * 1024
+EVENTS_FLUSH_INTERVAL = 1.0
+LOG_QUEUE_SIZE = 10_000
+LOG_QUEUE_SAMPLE_EVERY = 100
+OVERFLOW_POLICIES = ("block", "drop", "sample")
+EVENT_HEADER_KEYS = frozenset({"ts", "level", "logger", "message", "event"})
+
+if orjson is not None:
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value).decode("utf-8")
+else:
+
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False)
 
 
 class JsonlEventHandler(logging.Handler):
-    """A logging handler that writes structured events to a JSONL file."""
+    """A logging handler that writes structured events to a JSONL file.
+
+    The file stays open for the handler's lifetime. Lines are buffered and
+    written out once ``flush_bytes`` have accumulated or the oldest pending
+    line is ``flush_interval`` seconds old; a daemon thread enforces the
+    interval while the logger is idle, and :meth:`close` (called by
+    :func:`logging.shutdown` at exit) flushes whatever is left. All file
+    access happens under the handler lock, so threads can share it. With a
+    ``rotation`` policy the file is handed to a :class:`LogRotator` once it
+    is large or old enough (size is counted in characters written).
+    """
 
-    def __init__(self, output_file: Path) -> None:
+    def __init__(
+        self,
+        output_file: Path,
+        *,
+        flush_bytes: int = EVENTS_FLUSH_BYTES,
+        flush_interval: float = EVENTS_FLUSH_INTERVAL,
+        rotation: Optional[RotationPolicy] = None,
+    ) -> None:
         super().__init__(level=logging.INFO)
         self.output_file = output_file
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.rotator = LogRotator(output_file, rotation) if rotation is not None else None
+        self._stream: Optional[TextIO] = None
+        self._size = 0
+        self._pending = 0
+        self._first_pending = 0.0
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="jsonl-event-flush", daemon=True
+        )
+        self._flusher.start()
 
     def emit(self, record: logging.LogRecord) -> None:  # noqa: D401 - logging API
-        event = {
-            "ts": datetime.now(timezone.utc).isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-        }
-        if record.args and isinstance(record.args, dict):
-            event.update(record.args)
-        line = json.dumps(event, ensure_ascii=False)
-        with self.output_file.open("a", encoding="utf-8") as fh:
-            fh.write(line + "\n")
-
-
-def setup_logging(logs_dir: Path) -> logging.Logger:
-    """Configure the application logger and structured event sink."""
+        try:
+            line = getattr(record, "event_line", None)
+            if line is not None:
+                self._write(line)
+                return
+            event = {
+                "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+            }
+            if record.args and isinstance(record.args, dict):
+                event.update(record.args)
+            self._write(json.dumps(event, ensure_ascii=False) + "\n")
+        except Exception:
+            self.handleError(record)
+
+    def _write(self, line: str) -> None:
+        # Called with the handler lock held (Handler.handle acquires it).
+        if self.rotator is not None and self.rotator.should_rotate(self._size):
+            self._rotate_locked()
+        if self._stream is None:
+            self._stream = self.output_file.open("a", encoding="utf-8", buffering=self.flush_bytes)
+            self._size = self._stream.tell()
+        self._stream.write(line)
+        self._size += len(line)
+        now = time.monotonic()
+        if not self._pending:
+            self._first_pending = now
+        self._pending += len(line)
+        if self._pending >= self.flush_bytes or now - self._first_pending >= self.flush_interval:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._stream is not None and self._pending:
+            self._stream.flush()
+        self._pending = 0
+
+    def _rotate_locked(self) -> None:
+        if self._stream is not None:
+            self._flush_locked()
+            self._stream.close()
+            self._stream = None
+        self.rotator.rotate()
+        self._size = 0
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._flush_locked()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self._stop_flusher.set()
+        self.acquire()
+        try:
+            if self._stream is not None:
+                self._flush_locked()
+                self._stream.close()
+                self._stream = None
+        finally:
+            self.release()
+        super().close()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+
+
+class EventQueueHandler(logging.handlers.QueueHandler):
+    """Bounded :class:`~logging.handlers.QueueHandler` with an overflow policy.
+
+    ``block`` waits for room, ``drop`` discards records while the queue is
+    full and ``sample`` keeps one in every ``sample_every`` overflowing
+    records (waiting for room for that one) and discards the rest. Warnings
+    and errors are never discarded. The number of discarded records is
+    reported with the next record that fits.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        *,
+        overflow: str = "block",
+        sample_every: int = LOG_QUEUE_SAMPLE_EVERY,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.sample_every = sample_every
+        self.dropped = 0
+        self._overflowed = 0
+        self.listener: Optional[EventQueueListener] = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Event records from log_event are already fully rendered.
+        if hasattr(record, "event_line"):
+            return record
+        return super().prepare(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow != "block" and record.levelno < logging.WARNING:
+                self._overflowed += 1
+                if self.overflow == "drop" or self._overflowed % self.sample_every:
+                    self.dropped += 1
+                    return
+            self.queue.put(record)
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            warning = logging.LogRecord(
+                name=record.name,
+                level=logging.WARNING,
+                pathname="",
+                lineno=0,
+                msg="Log queue full; dropped %d records",
+                args=(dropped,),
+                exc_info=None,
+            )
+            self.queue.put(self.prepare(warning))
+
+
+class EventQueueListener(logging.handlers.QueueListener):
+    """Queue listener for a bounded :class:`EventQueueHandler` queue."""
+
+    def enqueue_sentinel(self) -> None:
+        # The queue is bounded; wait for room instead of raising queue.Full.
+        self.queue.put(self._sentinel)
+
+    def stop(self) -> None:
+        """Drain the queue, stop the thread and flush the sinks; safe to call twice."""
+
+        if self._thread is None:
+            return
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+
+
+def setup_logging(
+    logs_dir: Path,
+    *,
+    use_queue: bool = False,
+    queue_size: int = LOG_QUEUE_SIZE,
+    overflow: str = "block",
+    rotation: Optional[RotationPolicy] = None,
+) -> logging.Logger:
+    """Configure the application logger and structured event sink.
+
+    With ``use_queue`` the ``app.log`` and ``events.jsonl`` handlers run on a
+    :class:`EventQueueListener` thread and the logger only enqueues records
+    into a queue of at most ``queue_size`` entries; ``overflow`` selects what
+    happens when it is full (see :class:`EventQueueHandler`). The listener
+    drains the queue at interpreter exit.
+
+    ``rotation`` turns on size/time rotation with retention and background
+    compression for both files (see :class:`RotationPolicy`).
+    """
 
     app_log = logs_dir / "app.log"
     events_log = logs_dir / "events.jsonl"
@@ -44,37 +247,67 @@ def setup_logging(logs_dir: Path) -> logging.Logger:
     logger = logging.getLogger(APP_LOGGER_NAME)
     logger.setLevel(logging.INFO)
 
-    if not any(isinstance(h, logging.FileHandler) for h in logger.handlers):
-        file_handler = logging.FileHandler(app_log, encoding="utf-8")
+    configured = any(
+        isinstance(h, (logging.FileHandler, JsonlEventHandler, EventQueueHandler))
+        for h in logger.handlers
+    )
+    if not configured:
+        if rotation is not None:
+            file_handler = RotatingLogHandler(app_log, rotation)
+        else:
+            file_handler = logging.FileHandler(app_log, encoding="utf-8")
         formatter = logging.Formatter(
             fmt="%(asctime)s [%(levelname)s] %(name)s — %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-    if not any(isinstance(h, JsonlEventHandler) for h in logger.handlers):
-        json_handler = JsonlEventHandler(events_log)
-        logger.addHandler(json_handler)
+        json_handler = JsonlEventHandler(events_log, rotation=rotation)
+        if use_queue:
+            queue_handler = EventQueueHandler(queue.Queue(queue_size), overflow=overflow)
+            queue_handler.listener = EventQueueListener(
+                queue_handler.queue, file_handler, json_handler, respect_handler_level=True
+            )
+            queue_handler.listener.start()
+            atexit.register(queue_handler.listener.stop)
+            logger.addHandler(queue_handler)
+        else:
+            logger.addHandler(file_handler)
+            logger.addHandler(json_handler)
 
     logger.info("%s v%s logger initialized", APP_NAME, APP_VERSION)
     return logger
 
 
+@functools.lru_cache(maxsize=1024)
+def _event_header(logger_name: str, event: str) -> str:
+    """JSON fragment with the constant fields of an event line."""
+
+    name = json.dumps(logger_name, ensure_ascii=False)
+    event_name = json.dumps(event, ensure_ascii=False)
+    return f'"level": "INFO", "logger": {name}, "message": {event_name}, "event": {event_name}'
+
+
 def log_event(logger: logging.Logger, event: str, **payload: Any) -> None:
-    """Log a structured event to both human and machine readable sinks."""
-
-    enriched: Dict[str, Any] = {"event": event, **payload}
-    logger.info("event=%s %s", event, json.dumps(payload, ensure_ascii=False))
-    for handler in logger.handlers:
-        if isinstance(handler, JsonlEventHandler):
-            record = logging.LogRecord(
-                name=logger.name,
-                level=logging.INFO,
-                pathname="",
-                lineno=0,
-                msg=event,
-                args=enriched,
-                exc_info=None,
-            )
-            handler.handle(record)
+    """Log a structured event to both human and machine readable sinks.
+
+    The payload is serialised once (with :mod:`orjson` when installed) and
+    spliced into both the ``app.log`` message and the ``events.jsonl`` line,
+    which travel on a single record through :meth:`logging.Logger.handle`,
+    so child loggers reach the handlers configured on their ancestors.
+    """
+
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    body = _dumps(payload)
+    record = logger.makeRecord(logger.name, logging.INFO, "", 0, f"event={event} {body}", None, None)
+    ts = datetime.fromtimestamp(record.created, timezone.utc).isoformat()
+    head = f'{{"ts": "{ts}", {_event_header(logger.name, event)}'
+    if not payload:
+        record.event_line = head + "}\n"
+    elif EVENT_HEADER_KEYS.isdisjoint(payload):
+        record.event_line = f"{head}, {body[1:]}\n"
+    else:
+        # Payload overrides a header field; fall back to a merged document.
+        merged = {"ts": ts, "level": "INFO", "logger": logger.name, "message": event, "event": event}
+        record.event_line = _dumps({**merged, **payload}) + "\n"
+    logger.handle(record)
@@ -0,0 +1,102 @@
+"""Streaming multipart/form-data bodies for large file uploads."""
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+
+CHUNK_SIZE = 1024 * 1024
+PROGRESS_STEP = 1024 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class MultipartFileStream:
+    """A ``multipart/form-data`` body that streams a single file from disk.
+
+    The object is file-like (``read`` + ``__len__``), so ``requests`` sends it
+    with an exact ``Content-Length`` and pulls it in small blocks; at most one
+    ``chunk_size`` piece of the file is held in memory regardless of its size.
+    ``progress(sent, total)`` is called roughly every ``PROGRESS_STEP`` bytes
+    and once at the end.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        *,
+        field_name: str = "file",
+        fields: Optional[Dict[str, str]] = None,
+        content_type: str = "application/octet-stream",
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.file_path = file_path
+        self.boundary = uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+        parts = []
+        for name, value in (fields or {}).items():
+            parts.append(
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            )
+        filename = file_path.name.replace('"', "%22")
+        parts.append(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self._preamble = "".join(parts).encode("utf-8")
+        self._epilogue = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self._length = len(self._preamble) + file_path.stat().st_size + len(self._epilogue)
+
+        self._chunks = self.iter_chunks()
+        self._pending = bytearray()
+        self._sent = 0
+        self._reported = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yield the encoded body in pieces of at most ``chunk_size`` bytes."""
+
+        yield self._preamble
+        with self.file_path.open("rb") as fh:
+            while True:
+                piece = fh.read(self.chunk_size)
+                if not piece:
+                    break
+                yield piece
+        yield self._epilogue
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.chunk_size
+        while len(self._pending) < size:
+            piece = next(self._chunks, None)
+            if piece is None:
+                break
+            self._pending += piece
+        data = bytes(self._pending[:size])
+        del self._pending[:size]
+        self._advance(len(data))
+        return data
+
+    def close(self) -> None:
+        self._chunks.close()
+
+    def _advance(self, count: int) -> None:
+        self._sent += count
+        if self.progress is None:
+            return
+        if self._sent - self._reported >= PROGRESS_STEP or (self._sent == self._length and count):
+            self._reported = self._sent
+            self.progress(self._sent, self._length)
@@ -0,0 +1,68 @@
+"""Client-side token-bucket rate limiting for Roboflow API calls."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# endpoint class -> (requests per second, burst capacity)
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    "list": (20.0, 40.0),
+    "write": (5.0, 10.0),
+    "upload": (50.0, 100.0),
+}
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out reservations.
+
+    :meth:`acquire` takes its tokens immediately, letting the balance go
+    negative, and sleeps until the reservation is covered. Concurrent callers
+    therefore queue up in arrival order and together run at exactly ``rate``
+    once the burst is spent, instead of waking up at once and racing.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available; return the seconds waited."""
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """One :class:`TokenBucket` per endpoint class (``list`` / ``write`` / ``upload``).
+
+    The class defaults to ``list`` for read methods and ``write`` otherwise;
+    bulk data transfers pass ``upload`` explicitly.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None) -> None:
+        limits = DEFAULT_RATE_LIMITS if limits is None else limits
+        self.buckets = {name: TokenBucket(rate, burst) for name, (rate, burst) in limits.items()}
+
+    @staticmethod
+    def endpoint_class(method: str) -> str:
+        return "list" if method.upper() in READ_METHODS else "write"
+
+    def acquire(self, method: str, endpoint_class: Optional[str] = None) -> float:
+        """Wait for a token for the endpoint class; unknown classes are unlimited."""
+
+        bucket = self.buckets.get(endpoint_class or self.endpoint_class(method))
+        return bucket.acquire() if bucket is not None else 0.0
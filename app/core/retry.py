@@ -0,0 +1,88 @@
+"""Retry policy and retry budget for Roboflow API calls."""
+from __future__ import annotations
+
+import random
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+RETRYABLE_STATUSES: FrozenSet[int] = frozenset({408, 429, 502, 503, 504})
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Capped exponential backoff with full jitter.
+
+    Idempotent methods are always retryable; ``POST`` only when the caller
+    supplied an idempotency key. A ``Retry-After`` hint overrides the jittered
+    delay, and a hint longer than ``max_delay`` ends the retries instead of
+    stalling the caller.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES
+
+    def allows(self, method: str, *, idempotency_key: Optional[str] = None) -> bool:
+        method = method.upper()
+        return method in IDEMPOTENT_METHODS or (method == "POST" and bool(idempotency_key))
+
+    def delay(self, retry_number: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Seconds to sleep before retry ``retry_number`` (1-based), or ``None`` to give up."""
+
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (retry_number - 1)))
+        return random.uniform(0, ceiling)
+
+
+class RetryBudget:
+    """Limit retries to a fraction of recent traffic.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws
+    one, so a failing upstream sees at most ``1 + ratio`` times the original
+    load instead of ``max_attempts`` times. The balance starts at, and is
+    capped by, ``max_balance`` so short bursts of failures can still retry.
+    """
+
+    def __init__(self, *, ratio: float = 0.2, max_balance: float = 20.0) -> None:
+        self.ratio = ratio
+        self.max_balance = max_balance
+        self._balance = max_balance
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1.0:
+                return False
+            self._balance -= 1.0
+            return True
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -2,15 +2,35 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from .cache import CacheEntry, HierarchyDiskCache, ResponseCache
+from .circuit_breaker import CircuitBreaker
 from .config import mask_secret
 from .logging_util import log_event
+from .multipart import MultipartFileStream, ProgressCallback
+from .rate_limit import RateLimiter
+from .retry import RetryBudget, RetryPolicy, parse_retry_after
+from .singleflight import SingleFlight
 
 API_BASE_URL = "https://api.roboflow.com"
 REQUEST_TIMEOUT = 30
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+HIERARCHY_MAX_WORKERS = 8
+DATASET_UPLOAD_PATH = "/{workspace}/{project}/upload"
+UPLOAD_SESSIONS_PATH = "/{workspace}/{project}/uploads"
+IMAGE_UPLOAD_PATH = "/dataset/{project}/upload"
+ANNOTATION_UPLOAD_PATH = "/dataset/{project}/annotate/{image_id}"
 
 logger = logging.getLogger("roboflow_uploader.client")
 
@@ -22,93 +42,339 @@ class RoboflowAPIError(RuntimeError):
         super().__init__(f"Roboflow API error {status_code}: {message}")
         self.status_code = status_code
         self.payload = payload or {}
+        self.retries = 0
+
+
+class CircuitOpenError(RoboflowAPIError):
+    """Raised without contacting the API while the circuit breaker is open."""
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        retry_in = breaker.retry_in()
+        if retry_in > 0:
+            detail = f"failing fast for another {retry_in:.0f}s after repeated failures"
+        else:
+            detail = "failing fast while a probe request is in flight"
+        super().__init__(503, f"Circuit open for {breaker.name}; {detail}")
+
+
+def _merge_slug_mapping(raw: Dict[str, Any]) -> List[Dict[str, Any]]:
+    items = []
+    for slug, info in raw.items():
+        if isinstance(info, dict):
+            merged = {"slug": slug}
+            merged.update(info)
+            merged.setdefault("id", slug)
+        else:
+            merged = {"slug": slug, "id": slug, "name": str(info)}
+        items.append(merged)
+    return items
+
+
+def _copy_items(raw: List[Any]) -> List[Any]:
+    # Cached response bodies are shared, so hand callers their own dicts.
+    return [dict(item) if isinstance(item, dict) else item for item in raw]
+
+
+def parse_workspaces(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Normalise the ``workspaces`` field of a ``GET /`` response."""
+
+    workspaces_raw = data.get("workspaces", [])
+    if isinstance(workspaces_raw, dict):
+        return _merge_slug_mapping(workspaces_raw)
+    return _copy_items(workspaces_raw)
+
+
+def parse_projects(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Normalise the ``projects`` field of a ``GET /{workspace}`` response."""
+
+    projects_raw = data.get("projects", [])
+    if isinstance(projects_raw, dict):
+        return _merge_slug_mapping(projects_raw)
+    return _copy_items(projects_raw)
+
+
+def parse_versions(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Normalise the ``versions`` field of a ``GET /{workspace}/{project}`` response."""
+
+    versions_raw = data.get("versions", [])
+    if not isinstance(versions_raw, dict):
+        return _copy_items(versions_raw)
+    versions = []
+    for version_id, info in versions_raw.items():
+        if isinstance(info, dict):
+            merged = {"id": version_id, "version": version_id}
+            merged.update(info)
+        else:
+            merged = {
+                "id": version_id,
+                "version": version_id,
+                "name": str(info),
+            }
+        versions.append(merged)
+    return versions
+
+
+def api_error_from_response(response: Any, api_key: Optional[str]) -> RoboflowAPIError:
+    """Build a :class:`RoboflowAPIError` from a non-2xx HTTP response.
+
+    ``response`` only needs ``status_code``, ``text`` and ``json()``, so both
+    ``requests`` and ``httpx`` responses are accepted.
+    """
+
+    status = response.status_code
+    try:
+        payload = response.json()
+        message = payload.get("error") or payload.get("message") or response.text
+    except ValueError:
+        payload = None
+        message = response.text
+
+    if status in (401, 403):
+        masked = mask_secret(api_key)
+        message = f"Authentication failed for API key {masked}. {message}"
+    elif status == 404:
+        message = f"Resource not found. {message}"
+    elif status >= 500:
+        message = f"Roboflow service unavailable ({status}). {message}"
+
+    return RoboflowAPIError(status, message, payload=payload)
+
+
+@dataclass
+class HierarchyError:
+    """A listing failure for a single workspace or project node."""
+
+    workspace: str
+    project: Optional[str]
+    status_code: int
+    message: str
+
+
+@dataclass
+class HierarchyResult:
+    """Workspace → project → versions tree plus any per-node failures."""
+
+    hierarchy: Dict[str, Dict[str, List[Dict[str, Any]]]] = field(default_factory=dict)
+    errors: List[HierarchyError] = field(default_factory=list)
+
+
+def workspace_slug(workspace: Dict[str, Any]) -> Optional[str]:
+    """Return the identifier used in API paths for a workspace entry."""
+
+    return workspace.get("id") or workspace.get("slug")
+
+
+def project_slug(project: Dict[str, Any]) -> Optional[str]:
+    """Return the identifier used in API paths for a project entry."""
+
+    return project.get("name") or project.get("slug") or project.get("id")
 
 
 class RoboflowClient:
-    """Thin wrapper around the Roboflow REST API."""
+    """Thin wrapper around the Roboflow REST API, safe to share across worker threads."""
 
-    def __init__(self, api_key: Optional[str]) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str],
+        *,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        disk_cache: Optional[HierarchyDiskCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        base_url: Optional[str] = None,
+    ) -> None:
         self.api_key = api_key
+        self.base_url = (base_url or API_BASE_URL).rstrip("/")
+        self.disk_cache = disk_cache
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(urlsplit(self.base_url).netloc)
+        self._inflight = SingleFlight()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def __enter__(self) -> "RoboflowClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections. The client may be reused afterwards."""
+
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
 
     # ------------------------------------------------------------------
     # Listing helpers
     # ------------------------------------------------------------------
-    def list_workspaces(self) -> List[Dict[str, Any]]:
-        """Return available workspaces for the authenticated user."""
+    def list_workspaces(self, *, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Return available workspaces for the authenticated user.
+
+        ``refresh`` skips the cache TTL and revalidates against the API.
+        """
 
         if not self.api_key:
             return []
-        response = self._request("GET", "/")
-        data = response.json()
-        workspaces_raw = data.get("workspaces", [])
-        if isinstance(workspaces_raw, dict):
-            workspaces = []
-            for slug, info in workspaces_raw.items():
-                if isinstance(info, dict):
-                    merged = {"slug": slug}
-                    merged.update(info)
-                    merged.setdefault("id", slug)
-                else:
-                    merged = {"slug": slug, "id": slug, "name": str(info)}
-                workspaces.append(merged)
-        else:
-            workspaces = list(workspaces_raw)
-        log_event(logger, "rf_list_workspaces", count=len(workspaces))
+        data, source = self._get_json("/", level="workspaces", refresh=refresh)
+        workspaces = parse_workspaces(data)
+        log_event(logger, "rf_list_workspaces", count=len(workspaces), source=source)
         return workspaces
 
-    def list_projects(self, workspace: str) -> List[Dict[str, Any]]:
+    def list_projects(self, workspace: str, *, refresh: bool = False) -> List[Dict[str, Any]]:
         """List projects for a given workspace."""
 
         if not self.api_key:
             return []
-        response = self._request("GET", f"/{workspace}")
-        projects_raw = response.json().get("projects", [])
-        if isinstance(projects_raw, dict):
-            projects = []
-            for slug, info in projects_raw.items():
-                if isinstance(info, dict):
-                    merged = {"slug": slug}
-                    merged.update(info)
-                    merged.setdefault("id", slug)
-                else:
-                    merged = {"slug": slug, "id": slug, "name": str(info)}
-                projects.append(merged)
-        else:
-            projects = list(projects_raw)
-        log_event(logger, "rf_list_projects", workspace=workspace, count=len(projects))
+        data, source = self._get_json(f"/{workspace}", level="projects", refresh=refresh)
+        projects = parse_projects(data)
+        log_event(
+            logger,
+            "rf_list_projects",
+            workspace=workspace,
+            count=len(projects),
+            source=source,
+        )
         return projects
 
-    def list_versions(self, workspace: str, project: str) -> List[Dict[str, Any]]:
+    def list_versions(
+        self, workspace: str, project: str, *, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
         """List versions for a specific project."""
 
         if not self.api_key:
             return []
-        response = self._request("GET", f"/{workspace}/{project}")
-        versions_raw = response.json().get("versions", [])
-        if isinstance(versions_raw, dict):
-            versions = []
-            for version_id, info in versions_raw.items():
-                if isinstance(info, dict):
-                    merged = {"id": version_id, "version": version_id}
-                    merged.update(info)
-                else:
-                    merged = {
-                        "id": version_id,
-                        "version": version_id,
-                        "name": str(info),
-                    }
-                versions.append(merged)
-        else:
-            versions = list(versions_raw)
+        data, source = self._get_json(
+            f"/{workspace}/{project}", level="versions", refresh=refresh
+        )
+        versions = parse_versions(data)
         log_event(
             logger,
             "rf_list_versions",
             workspace=workspace,
             project=project,
             count=len(versions),
+            source=source,
         )
         return versions
 
+    def fetch_hierarchy(
+        self,
+        *,
+        max_workers: int = HIERARCHY_MAX_WORKERS,
+        refresh: bool = False,
+    ) -> HierarchyResult:
+        """Crawl workspaces, projects and versions over a bounded worker pool.
+
+        Workspaces and projects keep the order returned by the API. A failing
+        ``list_projects`` or ``list_versions`` call is recorded in
+        ``HierarchyResult.errors`` and its node is left empty; only a failure
+        to list workspaces aborts the crawl.
+        """
+
+        result = HierarchyResult()
+        slugs = [
+            slug
+            for slug in map(workspace_slug, self.list_workspaces(refresh=refresh))
+            if slug
+        ]
+        if not slugs:
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rf-crawl") as pool:
+            project_futures = {
+                slug: pool.submit(self.list_projects, slug, refresh=refresh) for slug in slugs
+            }
+            version_futures: Dict[str, List[Tuple[str, Future]]] = {}
+            for slug in slugs:
+                try:
+                    projects = project_futures[slug].result()
+                except RoboflowAPIError as exc:
+                    result.errors.append(HierarchyError(slug, None, exc.status_code, str(exc)))
+                    projects = []
+                version_futures[slug] = [
+                    (name, pool.submit(self.list_versions, slug, name, refresh=refresh))
+                    for name in map(project_slug, projects)
+                    if name
+                ]
+
+            for slug in slugs:
+                projects_tree: Dict[str, List[Dict[str, Any]]] = {}
+                for name, future in version_futures[slug]:
+                    try:
+                        projects_tree[name] = future.result()
+                    except RoboflowAPIError as exc:
+                        result.errors.append(HierarchyError(slug, name, exc.status_code, str(exc)))
+                        projects_tree[name] = []
+                result.hierarchy[slug] = projects_tree
+
+        log_event(
+            logger,
+            "rf_fetch_hierarchy",
+            workspaces=len(result.hierarchy),
+            projects=sum(len(projects) for projects in result.hierarchy.values()),
+            errors=len(result.errors),
+            response_cache=self.response_cache.stats(),
+        )
+        return result
+
+    def cached_hierarchy(self) -> Optional[HierarchyResult]:
+        """Build the hierarchy from the disk cache only, ignoring TTLs.
+
+        Returns ``None`` when there is no cache or no cached workspace list.
+        Nodes that were never cached are left empty.
+        """
+
+        cache = self.disk_cache
+        if cache is None:
+            return None
+        workspaces_entry = cache.get("workspaces", "/")
+        if workspaces_entry is None:
+            return None
+
+        result = HierarchyResult()
+        for slug in map(workspace_slug, parse_workspaces(workspaces_entry.data)):
+            if not slug:
+                continue
+            projects_entry = cache.get("projects", f"/{slug}")
+            projects = parse_projects(projects_entry.data) if projects_entry else []
+            projects_tree: Dict[str, List[Dict[str, Any]]] = {}
+            for name in map(project_slug, projects):
+                if not name:
+                    continue
+                versions_entry = cache.get("versions", f"/{slug}/{name}")
+                projects_tree[name] = parse_versions(versions_entry.data) if versions_entry else []
+            result.hierarchy[slug] = projects_tree
+        return result
+
+    def invalidate(self, workspace: str, project: Optional[str] = None) -> None:
+        """Drop cached responses for a workspace or project.
+
+        A project invalidation drops its version list from both caches.
+        """
+
+        if project is None:
+            path, level = f"/{workspace}", "projects"
+        else:
+            path, level = f"/{workspace}/{project}", "versions"
+        dropped = self.response_cache.invalidate_path(path)
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate(level, path)
+        log_event(logger, "rf_cache_invalidated", path=path, dropped=dropped)
+
     # ------------------------------------------------------------------
     # Metadata helpers
     # ------------------------------------------------------------------
@@ -119,6 +385,8 @@ class RoboflowClient:
         version: str,
         note: str,
         metadata: Optional[Dict[str, Any]] = None,
+        *,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Append a note/metadata blob to a version."""
 
@@ -130,8 +398,12 @@ class RoboflowClient:
             "POST",
             f"/{workspace}/{project}/{version}/notes",
             json=payload,
+            idempotency_key=idempotency_key,
         )
         result = response.json()
+        # Version details shown in the tree come from the project's version
+        # listing, so that is the entry a note makes stale.
+        self.invalidate(workspace, project)
         log_event(
             logger,
             "rf_append_note",
@@ -143,7 +415,7 @@ class RoboflowClient:
         return result
 
     # ------------------------------------------------------------------
-    # Dataset upload / training stubs
+    # Dataset upload / training
     # ------------------------------------------------------------------
     def upload_dataset(
         self,
@@ -152,14 +424,184 @@ class RoboflowClient:
         dataset_zip_path: str,
         *,
         description: str = "",
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         """Upload a dataset archive and create a new version.
 
-        This method is intentionally kept lightweight to satisfy the spec without
-        committing secrets. You may extend it to call the official Roboflow API.
+        The archive is streamed from disk as a multipart body, so memory use
+        does not grow with its size. ``progress(sent, total)`` receives
+        byte-level progress of the request body.
         """
 
-        raise NotImplementedError("Dataset upload requires project-specific implementation")
+        if not self.api_key:
+            raise RoboflowAPIError(401, "Missing API key")
+
+        archive = Path(dataset_zip_path)
+        body = MultipartFileStream(
+            archive,
+            fields={"description": description},
+            content_type="application/zip",
+            progress=progress,
+        )
+        started = time.perf_counter()
+        try:
+            response = self._request(
+                "POST",
+                DATASET_UPLOAD_PATH.format(workspace=workspace, project=project),
+                data=body,
+                headers={"Content-Type": body.content_type},
+                endpoint_class="upload",
+            )
+        finally:
+            body.close()
+        elapsed = time.perf_counter() - started
+        result = response.json()
+        self.invalidate(workspace, project)
+        log_event(
+            logger,
+            "rf_upload_dataset",
+            workspace=workspace,
+            project=project,
+            archive=archive.name,
+            size_bytes=len(body),
+            seconds=round(elapsed, 3),
+            version=result.get("version"),
+        )
+        return result
+
+    def start_upload_session(
+        self,
+        workspace: str,
+        project: str,
+        *,
+        filename: str,
+        size_bytes: int,
+        chunk_size: int,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Open a chunked upload session; the response carries ``session_id``."""
+
+        response = self._request(
+            "POST",
+            UPLOAD_SESSIONS_PATH.format(workspace=workspace, project=project),
+            json={"filename": filename, "size_bytes": size_bytes, "chunk_size": chunk_size},
+            idempotency_key=idempotency_key,
+        )
+        result = response.json()
+        log_event(
+            logger,
+            "rf_upload_session_started",
+            workspace=workspace,
+            project=project,
+            session_id=result.get("session_id"),
+            size_bytes=size_bytes,
+            chunk_size=chunk_size,
+        )
+        return result
+
+    def upload_chunk(
+        self,
+        workspace: str,
+        project: str,
+        session_id: str,
+        *,
+        index: int,
+        offset: int,
+        total_size: int,
+        data: bytes,
+        sha256: str,
+    ) -> Dict[str, Any]:
+        """``PUT`` one chunk of an upload session; safe to retry."""
+
+        path = UPLOAD_SESSIONS_PATH.format(workspace=workspace, project=project)
+        response = self._request(
+            "PUT",
+            f"{path}/{session_id}/chunks/{index}",
+            data=data,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Content-Range": f"bytes {offset}-{offset + len(data) - 1}/{total_size}",
+                "X-Chunk-SHA256": sha256,
+            },
+            endpoint_class="upload",
+        )
+        return response.json() if response.content else {}
+
+    def complete_upload_session(
+        self,
+        workspace: str,
+        project: str,
+        session_id: str,
+        *,
+        description: str = "",
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Finish an upload session and create the dataset version."""
+
+        path = UPLOAD_SESSIONS_PATH.format(workspace=workspace, project=project)
+        response = self._request(
+            "POST",
+            f"{path}/{session_id}/complete",
+            json={"description": description},
+            idempotency_key=idempotency_key,
+        )
+        result = response.json()
+        self.invalidate(workspace, project)
+        log_event(
+            logger,
+            "rf_upload_session_completed",
+            workspace=workspace,
+            project=project,
+            session_id=session_id,
+            version=result.get("version"),
+        )
+        return result
+
+    def upload_image(
+        self,
+        project: str,
+        name: str,
+        data: bytes,
+        *,
+        split: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Upload a single image; the response carries the new image ``id``."""
+
+        params = {"name": name}
+        if split:
+            params["split"] = split
+        response = self._request(
+            "POST",
+            IMAGE_UPLOAD_PATH.format(project=project),
+            params=params,
+            files={"file": (name, data)},
+            idempotency_key=idempotency_key,
+            endpoint_class="upload",
+        )
+        return response.json()
+
+    def upload_annotation(
+        self,
+        project: str,
+        image_id: str,
+        name: str,
+        annotation: bytes,
+        *,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Attach an annotation file to a previously uploaded image."""
+
+        response = self._request(
+            "POST",
+            ANNOTATION_UPLOAD_PATH.format(project=project, image_id=image_id),
+            params={"name": name},
+            data=annotation,
+            headers={"Content-Type": "text/plain"},
+            idempotency_key=idempotency_key,
+            endpoint_class="upload",
+        )
+        return response.json()
 
     def trigger_training(self, workspace: str, project: str, version: str) -> Dict[str, Any]:
         """Trigger a training job for a given dataset version."""
@@ -169,45 +611,205 @@ class RoboflowClient:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
-        if not self.api_key:
-            raise RoboflowAPIError(401, "Missing API key")
+    def _get_session(self) -> requests.Session:
+        """Return the pooled keep-alive session, created on first use.
+
+        At most ``pool_maxsize`` connections per host are handed out to the
+        threads sharing this client; :meth:`close` releases them.
+        """
+
+        session = self._session
+        if session is not None:
+            return session
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["Connection"] = "keep-alive"
+                self._session = session
+            return self._session
+
+    def _get_json(self, path: str, *, level: str, refresh: bool = False) -> Tuple[Any, str]:
+        """GET ``path`` through the caches; return ``(data, source)``.
+
+        The in-memory :class:`ResponseCache` is consulted first and
+        concurrent identical misses share one round-trip. With a
+        ``disk_cache``, entries are served while the per-level TTL holds and
+        revalidated with ETag/Last-Modified afterwards.
+        """
+
+        memory_key = ResponseCache.make_key(path)
+        if not refresh:
+            data = self.response_cache.get(memory_key)
+            if data is not None:
+                return data, "memory_cache"
+
+        (data, source), shared = self._inflight.do(
+            (path, refresh),
+            lambda: self._get_json_from_disk_or_network(path, level=level, refresh=refresh),
+        )
+        if shared:
+            return data, "coalesced"
+        self.response_cache.put(memory_key, data)
+        return data, source
+
+    def _get_json_from_disk_or_network(
+        self, path: str, *, level: str, refresh: bool
+    ) -> Tuple[Any, str]:
+        cache = self.disk_cache
+        entry = cache.get(level, path) if cache is not None else None
+        if entry is not None and not refresh and cache.is_fresh(level, entry):
+            return entry.data, "disk_cache"
+
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        response = self._request("GET", path, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            cache.touch(level, path, entry)
+            return entry.data, "revalidated"
 
-        params = kwargs.pop("params", {})
-        params.setdefault("api_key", self.api_key)
-        url = f"{API_BASE_URL}{path}"
         try:
-            response = requests.request(
-                method,
-                url,
-                params=params,
-                timeout=REQUEST_TIMEOUT,
-                **kwargs,
+            data = response.json()
+        except ValueError as exc:
+            raise RoboflowAPIError(
+                response.status_code, f"Invalid JSON response from {path}: {exc}"
+            ) from exc
+        if cache is not None:
+            cache.put(
+                level,
+                path,
+                CacheEntry(
+                    data=data,
+                    fetched_at=time.time(),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                ),
             )
-        except requests.RequestException as exc:  # noqa: BLE001
-            raise RoboflowAPIError(0, f"Network error: {exc}") from exc
+        return data, "network"
 
-        self._raise_for_status(response)
-        return response
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        idempotency_key: Optional[str] = None,
+        endpoint_class: Optional[str] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send one API call through the rate limiter, circuit breaker and retries.
+
+        Network errors and ``retry_policy.retry_statuses`` are retried with
+        backoff, bounded by the shared ``retry_budget``; ``POST`` is only
+        retried when ``idempotency_key`` is given, which is also sent as the
+        ``Idempotency-Key`` header.
+        """
 
-    def _raise_for_status(self, response: requests.Response) -> None:
-        if response.ok:
-            return
+        if not self.api_key:
+            raise RoboflowAPIError(401, "Missing API key")
 
-        status = response.status_code
-        try:
-            payload = response.json()
-            message = payload.get("error") or payload.get("message") or response.text
-        except ValueError:
-            payload = None
-            message = response.text
-
-        if status in (401, 403):
-            masked = mask_secret(self.api_key)
-            message = f"Authentication failed for API key {masked}. {message}"
-        elif status == 404:
-            message = f"Resource not found. {message}"
-        elif status >= 500:
-            message = f"Roboflow service unavailable ({status}). {message}"
-
-        raise RoboflowAPIError(status, message, payload=payload)
+        params = kwargs.pop("params", {})
+        params.setdefault("api_key", self.api_key)
+        if idempotency_key:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Idempotency-Key": idempotency_key}
+        url = f"{self.base_url}{path}"
+        policy = self.retry_policy
+        retryable = policy.allows(method, idempotency_key=idempotency_key)
+        self.retry_budget.deposit()
+
+        retries = 0
+        while True:
+            retry_after: Optional[float] = None
+            breaker = self.circuit_breaker
+            if not breaker.allow_request():
+                error = CircuitOpenError(breaker)
+                error.retries = retries
+                raise error
+            self.rate_limiter.acquire(method, endpoint_class)
+            try:
+                response = self._get_session().request(
+                    method,
+                    url,
+                    params=params,
+                    timeout=REQUEST_TIMEOUT,
+                    **kwargs,
+                )
+            except requests.RequestException as exc:  # noqa: BLE001
+                breaker.record_failure()
+                error = RoboflowAPIError(0, f"Network error: {exc}")
+                error.__cause__ = exc
+            except Exception:
+                # Anything else (e.g. an OSError from the transport) still
+                # ends the attempt; never leave a half-open probe in flight.
+                breaker.record_failure()
+                raise
+            except BaseException:
+                breaker.release_probe()
+                raise
+            else:
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if response.ok:
+                    if retries:
+                        log_event(
+                            logger,
+                            "rf_request_recovered",
+                            method=method,
+                            path=path,
+                            retries=retries,
+                        )
+                    return response
+                error = api_error_from_response(response, self.api_key)
+                if error.status_code not in policy.retry_statuses:
+                    error.retries = retries
+                    raise error
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                response.close()
+
+            delay: Optional[float] = None
+            if not retryable:
+                give_up = "not_idempotent"
+            elif retries + 1 >= policy.max_attempts:
+                give_up = "max_attempts"
+            elif (delay := policy.delay(retries + 1, retry_after)) is None:
+                give_up = "retry_after_exceeds_max_delay"
+            elif not self.retry_budget.try_withdraw():
+                give_up = "retry_budget_exhausted"
+            else:
+                give_up = None
+
+            if give_up is not None:
+                error.retries = retries
+                log_event(
+                    logger,
+                    "rf_request_failed",
+                    method=method,
+                    path=path,
+                    status_code=error.status_code,
+                    retries=retries,
+                    reason=give_up,
+                )
+                raise error
+
+            retries += 1
+            log_event(
+                logger,
+                "rf_request_retry",
+                method=method,
+                path=path,
+                status_code=error.status_code,
+                attempt=retries,
+                delay=round(delay, 3),
+                retry_after=retry_after,
+            )
+            time.sleep(delay)
@@ -0,0 +1,87 @@
+"""SQLite index of image content already uploaded to each project."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploaded_images (
+    workspace TEXT NOT NULL,
+    project TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    image_id TEXT,
+    annotation_sha256 TEXT,
+    name TEXT,
+    uploaded_at TEXT NOT NULL,
+    PRIMARY KEY (workspace, project, sha256)
+)
+"""
+
+
+class IndexedImage(NamedTuple):
+    image_id: Optional[str]
+    annotation_sha256: Optional[str]
+
+
+class UploadIndex:
+    """Remember which image hashes each project already has.
+
+    One database holds every project, keyed by ``(workspace, project,
+    sha256)``. The stored annotation hash lets callers tell an unchanged item
+    from one whose labels changed. A single connection is shared by worker
+    threads behind a lock; WAL mode keeps the per-image commits cheap.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def lookup(self, workspace: str, project: str, sha256: str) -> Optional[IndexedImage]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT image_id, annotation_sha256 FROM uploaded_images "
+                "WHERE workspace = ? AND project = ? AND sha256 = ?",
+                (workspace, project, sha256),
+            ).fetchone()
+        return IndexedImage(*row) if row else None
+
+    def record(
+        self,
+        workspace: str,
+        project: str,
+        sha256: str,
+        *,
+        size_bytes: int,
+        image_id: Optional[str],
+        annotation_sha256: Optional[str],
+        name: str,
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO uploaded_images VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    workspace,
+                    project,
+                    sha256,
+                    size_bytes,
+                    image_id,
+                    annotation_sha256,
+                    name,
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
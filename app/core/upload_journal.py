@@ -0,0 +1,162 @@
+"""Persisted chunk journal for resumable dataset uploads."""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+JOURNAL_SUFFIX = ".chunks.jsonl"
+
+
+@dataclass
+class UploadJournal:
+    """Append-only record of an upload session and its acknowledged chunks.
+
+    The journal lives next to the operation manifest as
+    ``<operation_id>.chunks.jsonl``. The first line describes the session and
+    the archive it belongs to (path, size, mtime); every acknowledged chunk
+    appends one line with its offset, length and SHA-256, and a final
+    ``complete`` line closes the session. Appending keeps each update O(1)
+    and a line torn by a crash is skipped on load.
+    """
+
+    path: Path
+    operation_id: str
+    session_id: str
+    workspace: str
+    project: str
+    archive: str
+    archive_size: int
+    archive_mtime_ns: int
+    chunk_size: int
+    chunks: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    completed: bool = False
+
+    @classmethod
+    def create(
+        cls,
+        manifests_dir: Path,
+        *,
+        operation_id: str,
+        session_id: str,
+        workspace: str,
+        project: str,
+        archive: Path,
+        chunk_size: int,
+    ) -> "UploadJournal":
+        stat = archive.stat()
+        journal = cls(
+            path=manifests_dir / f"{operation_id}{JOURNAL_SUFFIX}",
+            operation_id=operation_id,
+            session_id=session_id,
+            workspace=workspace,
+            project=project,
+            archive=str(archive.resolve()),
+            archive_size=stat.st_size,
+            archive_mtime_ns=stat.st_mtime_ns,
+            chunk_size=chunk_size,
+        )
+        journal.path.parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            "type": "session",
+            "operation_id": operation_id,
+            "session_id": session_id,
+            "workspace": workspace,
+            "project": project,
+            "archive": journal.archive,
+            "archive_size": journal.archive_size,
+            "archive_mtime_ns": journal.archive_mtime_ns,
+            "chunk_size": chunk_size,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with journal.path.open("w", encoding="utf-8") as fh:
+            fh.write(json.dumps(header) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        return journal
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["UploadJournal"]:
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return None
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+        if not records or records[0].get("type") != "session":
+            return None
+        header = records[0]
+        journal = cls(
+            path=path,
+            operation_id=header["operation_id"],
+            session_id=header["session_id"],
+            workspace=header["workspace"],
+            project=header["project"],
+            archive=header["archive"],
+            archive_size=header["archive_size"],
+            archive_mtime_ns=header["archive_mtime_ns"],
+            chunk_size=header["chunk_size"],
+        )
+        for record in records[1:]:
+            if record.get("type") == "chunk":
+                journal.chunks[record["index"]] = record
+            elif record.get("type") == "complete":
+                journal.completed = True
+        return journal
+
+    @classmethod
+    def find_resumable(
+        cls, manifests_dir: Path, *, workspace: str, project: str, archive: Path
+    ) -> Optional["UploadJournal"]:
+        """Return the newest unfinished journal for this exact archive, if any."""
+
+        try:
+            stat = archive.stat()
+        except OSError:
+            return None
+        resolved = str(archive.resolve())
+        for path in sorted(manifests_dir.glob(f"*{JOURNAL_SUFFIX}"), reverse=True):
+            journal = cls.load(path)
+            if (
+                journal is not None
+                and not journal.completed
+                and journal.workspace == workspace
+                and journal.project == project
+                and journal.archive == resolved
+                and journal.archive_size == stat.st_size
+                and journal.archive_mtime_ns == stat.st_mtime_ns
+            ):
+                return journal
+        return None
+
+    def is_acknowledged(self, index: int, offset: int, length: int) -> bool:
+        record = self.chunks.get(index)
+        return record is not None and record["offset"] == offset and record["length"] == length
+
+    def acknowledge(self, index: int, offset: int, length: int, sha256: str) -> None:
+        record = {
+            "type": "chunk",
+            "index": index,
+            "offset": offset,
+            "length": length,
+            "sha256": sha256,
+        }
+        self._append(record)
+        self.chunks[index] = record
+
+    def mark_complete(self, response: Dict[str, Any]) -> None:
+        self._append({"type": "complete", "version": response.get("version")})
+        self.completed = True
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
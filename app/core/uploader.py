@@ -2,14 +2,53 @@
 from __future__ import annotations
 
 import hashlib
-import shutil
-from pathlib import Path
-from typing import Dict, Optional
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from .artifacts import HASH_ALGORITHM, TREE_HASH_ALGORITHM, ArtifactStore
 from .config import APP_VERSION
+from .dataset_archive import (
+    DatasetDiff,
+    DatasetItem,
+    build_file_index,
+    diff_file_index,
+    scan_archive,
+)
+from .hash_cache import HashCache
 from .logging_util import log_event
+from .multipart import ProgressCallback
 from .roboflow_client import RoboflowClient, RoboflowAPIError
-from .versioning import generate_operation_id, write_manifest
+from .upload_index import UploadIndex
+from .upload_journal import UploadJournal
+from .versioning import generate_operation_id, iter_manifests, write_manifest
+
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+RESUMABLE_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+IMAGE_UPLOAD_WORKERS = 8
+LINK_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class LinkJob:
+    """One artifact to link to one version in :meth:`UploadManager.link_external_models`."""
+
+    file_path: Path
+    workspace: str
+    project: str
+    version: str
+    storage_note: Optional[str] = None
+
+
+def _file_identity(path: Path) -> Any:
+    try:
+        stat = path.stat()
+    except OSError:
+        return path  # reported when the artifact store tries to read it
+    return stat.st_dev, stat.st_ino
 
 
 class UploadManager:
@@ -22,25 +61,54 @@ class UploadManager:
         artifacts_dir: Path,
         manifests_dir: Path,
         logger,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        resumable_threshold: int = RESUMABLE_UPLOAD_THRESHOLD,
+        upload_index: Optional[UploadIndex] = None,
+        hash_cache: Optional[HashCache] = None,
+        tree_hash: bool = False,
     ) -> None:
         self.client = client
         self.artifacts_dir = artifacts_dir
         self.manifests_dir = manifests_dir
         self.logger = logger
+        self.chunk_size = chunk_size
+        self.resumable_threshold = resumable_threshold
+        self.upload_index = upload_index
+        self.hash_cache = hash_cache
+        self.artifact_store = ArtifactStore(
+            artifacts_dir,
+            hash_cache=hash_cache,
+            hash_algorithm=TREE_HASH_ALGORITHM if tree_hash else HASH_ALGORITHM,
+        )
 
     # ------------------------------------------------------------------
     # Utility helpers
     # ------------------------------------------------------------------
-    def _copy_artifact(self, file_path: Path) -> Dict[str, str]:
-        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
-        destination = self.artifacts_dir / file_path.name
-        shutil.copy2(file_path, destination)
-        sha256 = hashlib.sha256(destination.read_bytes()).hexdigest()
+    def _copy_artifact(self, file_path: Path, *, aliases: Sequence[str] = ()) -> Dict[str, Any]:
+        stored = self.artifact_store.put(file_path, aliases=aliases)
+        if stored.stale_cache:
+            log_event(
+                self.logger,
+                "artifact_hash_cache_stale",
+                filename=file_path.name,
+                algorithm=stored.algorithm,
+                digest=stored.digest,
+            )
+        log_event(
+            self.logger,
+            "artifact_stored",
+            filename=file_path.name,
+            algorithm=stored.algorithm,
+            digest=stored.digest,
+            size_bytes=stored.size_bytes,
+            **stored.metadata(),
+        )
         return {
-            "filename": destination.name,
-            "sha256": sha256,
-            "size_bytes": destination.stat().st_size,
-            "storage_url": destination.resolve().as_uri(),
+            "filename": file_path.name,
+            **stored.checksum(),
+            "size_bytes": stored.size_bytes,
+            "storage_url": stored.path.resolve().as_uri(),
+            "copy": stored.metadata(),
         }
 
     def _persist_manifest(self, operation_id: str, payload: Dict[str, object]) -> Path:
@@ -72,15 +140,7 @@ class UploadManager:
         )
 
         artifact = self._copy_artifact(file_path)
-        metadata = {
-            "artifact": artifact,
-            "storage_note": storage_note or "stored locally",
-            "app_version": APP_VERSION,
-        }
-        note = (
-            f"External model artifact {artifact['filename']} stored at {artifact['storage_url']}\n"
-            f"Checksum (sha256): {artifact['sha256']}"
-        )
+        note, metadata = self._version_note(artifact, storage_note)
 
         try:
             response = self.client.append_version_note(
@@ -89,6 +149,7 @@ class UploadManager:
                 version=version,
                 note=note,
                 metadata=metadata,
+                idempotency_key=uuid.uuid4().hex,
             )
         except RoboflowAPIError as exc:
             manifest = self._persist_manifest(
@@ -101,6 +162,7 @@ class UploadManager:
                     "artifact": artifact,
                     "status": "error",
                     "error": str(exc),
+                    "retries": getattr(exc, "retries", 0),
                     "payload": getattr(exc, "payload", {}),
                 },
             )
@@ -109,6 +171,7 @@ class UploadManager:
                 "external_model_link_failed",
                 operation_id=operation_id,
                 manifest=str(manifest),
+                retries=getattr(exc, "retries", 0),
             )
             raise
 
@@ -136,6 +199,169 @@ class UploadManager:
             "api_response": response,
         }
 
+    def link_external_models(
+        self,
+        jobs: Sequence[LinkJob],
+        *,
+        max_workers: int = LINK_WORKERS,
+        progress_callback: Optional[ProgressCallback] = None,
+        result_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, object]:
+        """Link many artifacts to many versions in one operation.
+
+        Each distinct file is hashed and stored once, however many versions
+        it is linked to; paths naming the same file (hard links, symlinks,
+        ``a/best.pt`` and ``./a/best.pt``) are grouped by device and inode
+        first. Distinct files with identical content are each hashed but
+        copied once by the artifact store. Notes are then appended
+        concurrently on at most ``max_workers`` threads. ``result_callback``
+        receives every job result as soon as it finishes (called from this
+        thread, in completion order) and one aggregate manifest records them
+        all.
+        """
+
+        operation_id = generate_operation_id("extb")
+        files: Dict[Any, List[Path]] = {}
+        for path in dict.fromkeys(job.file_path for job in jobs):
+            files.setdefault(_file_identity(path), []).append(path)
+        log_event(
+            self.logger,
+            "external_model_batch_started",
+            operation_id=operation_id,
+            jobs=len(jobs),
+            files=len(files),
+            max_workers=max_workers,
+        )
+
+        artifacts: Dict[Path, Dict[str, Any]] = {}
+        store_errors: Dict[Path, str] = {}
+        results: List[Dict[str, Any]] = []
+        done = 0
+
+        def report(result: Dict[str, Any]) -> None:
+            nonlocal done
+            done += 1
+            results.append(result)
+            if result_callback is not None:
+                result_callback(result)
+            if progress_callback is not None:
+                progress_callback(done, len(jobs))
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rf-link") as pool:
+            stored = {
+                pool.submit(
+                    self._copy_artifact,
+                    paths[0],
+                    aliases=[path.name for path in paths[1:]],
+                ): paths
+                for paths in files.values()
+            }
+            for future in as_completed(stored):
+                paths = stored[future]
+                try:
+                    artifact = future.result()
+                except OSError as exc:
+                    store_errors.update(dict.fromkeys(paths, str(exc)))
+                    continue
+                for path in paths:
+                    artifacts[path] = {**artifact, "filename": path.name}
+
+            pending = {}
+            for index, job in enumerate(jobs):
+                if job.file_path in store_errors:
+                    error = store_errors[job.file_path]
+                    report(self._link_result(index, job, status="error", error=error))
+                else:
+                    pending[pool.submit(self._link_job, artifacts[job.file_path], job)] = index
+            for future in as_completed(pending):
+                index = pending[future]
+                report(self._link_result(index, jobs[index], **future.result()))
+
+        results.sort(key=lambda result: result["index"])
+        failed = sum(1 for result in results if result["status"] == "error")
+        status = "success" if not failed else "partial" if failed < len(results) else "error"
+        summary = {
+            "jobs": len(jobs),
+            "files": len(files),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+        }
+        manifest = self._persist_manifest(
+            operation_id,
+            {
+                "mode": "external_model_batch",
+                "status": status,
+                "summary": summary,
+                "artifacts": {str(path): artifact for path, artifact in artifacts.items()},
+                "jobs": results,
+            },
+        )
+        log_event(
+            self.logger,
+            "external_model_batch_completed",
+            operation_id=operation_id,
+            manifest=str(manifest),
+            status=status,
+            **summary,
+        )
+        return {
+            "operation_id": operation_id,
+            "manifest": manifest,
+            "status": status,
+            "summary": summary,
+            "results": results,
+        }
+
+    def _link_job(self, artifact: Dict[str, Any], job: LinkJob) -> Dict[str, Any]:
+        note, metadata = self._version_note(artifact, job.storage_note)
+        try:
+            response = self.client.append_version_note(
+                workspace=job.workspace,
+                project=job.project,
+                version=job.version,
+                note=note,
+                metadata=metadata,
+                idempotency_key=uuid.uuid4().hex,
+            )
+        except RoboflowAPIError as exc:
+            return {
+                "status": "error",
+                "error": str(exc),
+                "retries": getattr(exc, "retries", 0),
+                "artifact": artifact["storage_url"],
+            }
+        return {"status": "success", "api_response": response, "artifact": artifact["storage_url"]}
+
+    @staticmethod
+    def _link_result(index: int, job: LinkJob, **outcome: Any) -> Dict[str, Any]:
+        return {
+            "index": index,
+            "file": str(job.file_path),
+            "workspace": job.workspace,
+            "project": job.project,
+            "target_version": job.version,
+            **outcome,
+        }
+
+    @staticmethod
+    def _version_note(
+        artifact: Dict[str, Any], storage_note: Optional[str]
+    ) -> Tuple[str, Dict[str, Any]]:
+        if "sha256" in artifact:
+            algorithm, digest = "sha256", artifact["sha256"]
+        else:
+            algorithm, digest = artifact["tree_hash"]["algorithm"], artifact["tree_hash"]["digest"]
+        metadata = {
+            "artifact": artifact,
+            "storage_note": storage_note or "stored locally",
+            "app_version": APP_VERSION,
+        }
+        note = (
+            f"External model artifact {artifact['filename']} stored at {artifact['storage_url']}\n"
+            f"Checksum ({algorithm}): {digest}"
+        )
+        return note, metadata
+
     # ------------------------------------------------------------------
     # Dataset workflow (Mode A)
     # ------------------------------------------------------------------
@@ -147,8 +373,28 @@ class UploadManager:
         dataset_zip_path: Path,
         trigger_training: bool = False,
         description: str = "",
+        progress_callback: Optional[ProgressCallback] = None,
+        resumable: Optional[bool] = None,
     ) -> Dict[str, object]:
-        operation_id = generate_operation_id("ds")
+        """Upload a dataset archive as a new version.
+
+        Archives of at least ``resumable_threshold`` bytes (or any archive when
+        ``resumable`` is True) go through a chunked upload session journaled
+        next to the manifest; re-running the same upload after a failure skips
+        the chunks the server already acknowledged.
+        """
+
+        if resumable is None:
+            resumable = dataset_zip_path.stat().st_size >= self.resumable_threshold
+        journal = None
+        if resumable:
+            journal = UploadJournal.find_resumable(
+                self.manifests_dir,
+                workspace=workspace,
+                project=project,
+                archive=dataset_zip_path,
+            )
+        operation_id = journal.operation_id if journal else generate_operation_id("ds")
         log_event(
             self.logger,
             "dataset_upload_started",
@@ -156,40 +402,37 @@ class UploadManager:
             workspace=workspace,
             project=project,
             archive=str(dataset_zip_path),
+            resumable=resumable,
+            resumed=journal is not None,
         )
 
+        upload_info: Dict[str, Any] = {"transport": "chunked" if resumable else "multipart"}
+        # The whole archive is still sent; the index and diff are recorded so
+        # later uploads (either transport) can be computed against this one.
+        file_index = self._index_archive(dataset_zip_path)
+        base = self._previous_dataset_manifest(workspace, project) if file_index is not None else None
+        diff = diff_file_index(base["file_index"], file_index) if base else None
         try:
-            response = self.client.upload_dataset(
-                workspace=workspace,
-                project=project,
-                dataset_zip_path=str(dataset_zip_path),
-                description=description,
-            )
+            if resumable:
+                response = self._upload_dataset_chunked(
+                    operation_id,
+                    journal,
+                    workspace=workspace,
+                    project=project,
+                    archive=dataset_zip_path,
+                    description=description,
+                    progress_callback=progress_callback,
+                    upload_info=upload_info,
+                )
+            else:
+                response = self.client.upload_dataset(
+                    workspace=workspace,
+                    project=project,
+                    dataset_zip_path=str(dataset_zip_path),
+                    description=description,
+                    progress=progress_callback,
+                )
             version = response.get("version")
-        except NotImplementedError as exc:
-            log_event(
-                self.logger,
-                "dataset_upload_not_implemented",
-                operation_id=operation_id,
-                reason=str(exc),
-            )
-            manifest = self._persist_manifest(
-                operation_id,
-                {
-                    "mode": "dataset",
-                    "workspace": workspace,
-                    "project": project,
-                    "dataset_archive": str(dataset_zip_path),
-                    "status": "pending",
-                    "notes": str(exc),
-                },
-            )
-            return {
-                "operation_id": operation_id,
-                "manifest": manifest,
-                "status": "pending",
-                "message": str(exc),
-            }
         except RoboflowAPIError as exc:
             manifest = self._persist_manifest(
                 operation_id,
@@ -198,8 +441,10 @@ class UploadManager:
                     "workspace": workspace,
                     "project": project,
                     "dataset_archive": str(dataset_zip_path),
+                    "upload": upload_info,
                     "status": "error",
                     "error": str(exc),
+                    "retries": getattr(exc, "retries", 0),
                     "payload": getattr(exc, "payload", {}),
                 },
             )
@@ -225,9 +470,12 @@ class UploadManager:
                 "workspace": workspace,
                 "project": project,
                 "dataset_archive": str(dataset_zip_path),
+                "upload": upload_info,
                 "status": "success",
                 "api_response": response,
                 "training_response": training_response,
+                "diff": self._diff_payload(base, diff),
+                "file_index": file_index,
             },
         )
         log_event(
@@ -243,6 +491,380 @@ class UploadManager:
             "training_response": training_response,
         }
 
+    def _upload_dataset_chunked(
+        self,
+        operation_id: str,
+        journal: Optional[UploadJournal],
+        *,
+        workspace: str,
+        project: str,
+        archive: Path,
+        description: str,
+        progress_callback: Optional[ProgressCallback],
+        upload_info: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        if journal is not None:
+            try:
+                return self._send_chunks(
+                    journal,
+                    description=description,
+                    progress_callback=progress_callback,
+                    upload_info=upload_info,
+                )
+            except RoboflowAPIError as exc:
+                if exc.status_code not in (404, 410):
+                    raise
+                log_event(
+                    self.logger,
+                    "dataset_upload_session_expired",
+                    operation_id=operation_id,
+                    session_id=journal.session_id,
+                )
+
+        session = self.client.start_upload_session(
+            workspace,
+            project,
+            filename=archive.name,
+            size_bytes=archive.stat().st_size,
+            chunk_size=self.chunk_size,
+            idempotency_key=uuid.uuid4().hex,
+        )
+        journal = UploadJournal.create(
+            self.manifests_dir,
+            operation_id=operation_id,
+            session_id=session["session_id"],
+            workspace=workspace,
+            project=project,
+            archive=archive,
+            chunk_size=self.chunk_size,
+        )
+        return self._send_chunks(
+            journal,
+            description=description,
+            progress_callback=progress_callback,
+            upload_info=upload_info,
+        )
+
+    def _send_chunks(
+        self,
+        journal: UploadJournal,
+        *,
+        description: str,
+        progress_callback: Optional[ProgressCallback],
+        upload_info: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        total = journal.archive_size
+        skipped = 0
+        upload_info.update(
+            journal=str(journal.path),
+            session_id=journal.session_id,
+            chunk_size=journal.chunk_size,
+        )
+        with open(journal.archive, "rb") as fh:
+            for index, offset in enumerate(range(0, total, journal.chunk_size)):
+                length = min(journal.chunk_size, total - offset)
+                if journal.is_acknowledged(index, offset, length):
+                    skipped += 1
+                else:
+                    fh.seek(offset)
+                    data = fh.read(length)
+                    digest = hashlib.sha256(data).hexdigest()
+                    self.client.upload_chunk(
+                        journal.workspace,
+                        journal.project,
+                        journal.session_id,
+                        index=index,
+                        offset=offset,
+                        total_size=total,
+                        data=data,
+                        sha256=digest,
+                    )
+                    journal.acknowledge(index, offset, length, digest)
+                upload_info.update(chunks=index + 1, resumed_chunks=skipped)
+                if progress_callback is not None:
+                    progress_callback(offset + length, total)
+
+        response = self.client.complete_upload_session(
+            journal.workspace,
+            journal.project,
+            journal.session_id,
+            description=description,
+            idempotency_key=f"{journal.session_id}-complete",
+        )
+        journal.mark_complete(response)
+        return response
+
+    def upload_dataset_images(
+        self,
+        *,
+        workspace: str,
+        project: str,
+        dataset_zip_path: Path,
+        max_workers: int = IMAGE_UPLOAD_WORKERS,
+        progress_callback: Optional[ProgressCallback] = None,
+        delta: bool = True,
+    ) -> Dict[str, object]:
+        """Upload each image of the archive individually over a worker pool.
+
+        Images and annotations are read straight from the zip, so nothing is
+        extracted to disk and at most ``max_workers`` images are in memory.
+        Transient failures are retried by the client under a per-request
+        idempotency key; the manifest lists every item's outcome (failed
+        items with their retry count) and a success/failure summary. With an
+        ``upload_index``, images whose content hash the project already has
+        are not sent again (only changed annotations are), and the skipped
+        bytes are reported.
+
+        With ``delta`` the archive's file index is diffed against the last
+        successful dataset manifest for the same project and only added or
+        relabelled images are processed; unchanged ones are not even read.
+        """
+
+        operation_id = generate_operation_id("ds")
+        with zipfile.ZipFile(dataset_zip_path) as archive:
+            items = scan_archive(archive)
+            file_index = build_file_index(items)
+            base = self._previous_dataset_manifest(workspace, project) if delta else None
+            base_index: Dict[str, Dict[str, Any]] = base["file_index"] if base else {}
+            diff = diff_file_index(base_index, file_index) if base else None
+            if diff is not None:
+                wanted = set(diff.added) | set(diff.changed_label)
+                pending = [item for item in items if item.image in wanted]
+            else:
+                pending = items
+            log_event(
+                self.logger,
+                "dataset_images_upload_started",
+                operation_id=operation_id,
+                workspace=workspace,
+                project=project,
+                archive=str(dataset_zip_path),
+                items=len(items),
+                pending=len(pending),
+                base_operation_id=base["op_id"] if base else None,
+                max_workers=max_workers,
+            )
+            relabelled = set(diff.changed_label) if diff else set()
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rf-upload") as pool:
+                futures = [
+                    pool.submit(
+                        self._upload_item,
+                        archive,
+                        workspace,
+                        project,
+                        item,
+                        image_id=(
+                            base_index[item.image].get("image_id")
+                            if item.image in relabelled
+                            else None
+                        ),
+                    )
+                    for item in pending
+                ]
+                for done, _ in enumerate(as_completed(futures), start=1):
+                    if progress_callback is not None:
+                        progress_callback(done, len(pending))
+                results = [future.result() for future in futures]
+
+        # The stored index describes what the project now holds: failed items
+        # keep their previous fingerprint (or are dropped) so the next diff
+        # picks them up again.
+        for name in diff.unchanged if diff else ():
+            file_index[name]["image_id"] = base_index[name].get("image_id")
+        for result in results:
+            name = result["image"]
+            if result["status"] != "error":
+                file_index[name]["image_id"] = result.get("image_id")
+            elif name in base_index:
+                file_index[name] = base_index[name]
+            else:
+                del file_index[name]
+
+        succeeded = [r for r in results if r["status"] in ("success", "skipped")]
+        summary = {
+            "total": len(results),
+            "succeeded": len(succeeded),
+            "failed": len(results) - len(succeeded),
+            "skipped": sum(1 for r in results if r["status"] == "skipped"),
+            "bytes_uploaded": sum(
+                r["size_bytes"]
+                for r in results
+                if r["status"] == "success" and not r.get("deduplicated")
+            ),
+            "skipped_bytes": sum(r["size_bytes"] for r in results if r.get("deduplicated")),
+        }
+        if not summary["failed"]:
+            status = "success"
+        elif succeeded:
+            status = "partial"
+        else:
+            status = "error"
+        manifest = self._persist_manifest(
+            operation_id,
+            {
+                "mode": "dataset",
+                "workspace": workspace,
+                "project": project,
+                "dataset_archive": str(dataset_zip_path),
+                "upload": {"transport": "per_image", "max_workers": max_workers},
+                "status": status,
+                "summary": summary,
+                "diff": self._diff_payload(base, diff),
+                "items": results,
+                "file_index": file_index,
+            },
+        )
+        log_event(
+            self.logger,
+            "dataset_images_upload_completed",
+            operation_id=operation_id,
+            manifest=str(manifest),
+            status=status,
+            **summary,
+        )
+        return {
+            "operation_id": operation_id,
+            "manifest": manifest,
+            "status": status,
+            "summary": summary,
+        }
+
+    def _previous_dataset_manifest(self, workspace: str, project: str) -> Optional[Dict[str, Any]]:
+        for manifest in iter_manifests(self.manifests_dir, prefix="ds-"):
+            if (
+                manifest.get("mode") == "dataset"
+                and manifest.get("workspace") == workspace
+                and manifest.get("project") == project
+                and manifest.get("status") in ("success", "partial")
+                and isinstance(manifest.get("file_index"), dict)
+            ):
+                return manifest
+        return None
+
+    @staticmethod
+    def _diff_payload(
+        base: Optional[Dict[str, Any]], diff: Optional[DatasetDiff]
+    ) -> Optional[Dict[str, Any]]:
+        if base is None or diff is None:
+            return None
+        return {
+            "base_operation_id": base.get("op_id"),
+            "summary": diff.summary(),
+            "added": diff.added,
+            "removed": diff.removed,
+            "changed_label": diff.changed_label,
+        }
+
+    def _index_archive(self, dataset_zip_path: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+        try:
+            with zipfile.ZipFile(dataset_zip_path) as archive:
+                return build_file_index(scan_archive(archive))
+        except (OSError, zipfile.BadZipFile):
+            return None
+
+    def _upload_item(
+        self,
+        archive: zipfile.ZipFile,
+        workspace: str,
+        project: str,
+        item: DatasetItem,
+        *,
+        image_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "image": item.image,
+            "annotation": item.annotation,
+            "split": item.split,
+            "size_bytes": item.size_bytes,
+        }
+        if image_id:
+            # Relabelled item whose image the project already holds.
+            result["image_id"] = image_id
+            result["deduplicated"] = True
+        try:
+            image = archive.read(item.image)
+            annotation = archive.read(item.annotation) if item.annotation else None
+        except (OSError, zipfile.BadZipFile) as exc:
+            result.update(status="error", error=str(exc))
+            log_event(self.logger, "dataset_image_failed", image=item.image, error=str(exc))
+            return result
+
+        image_sha256 = hashlib.sha256(image).hexdigest()
+        annotation_sha256 = hashlib.sha256(annotation).hexdigest() if annotation is not None else None
+        result["sha256"] = image_sha256
+        known = (
+            self.upload_index.lookup(workspace, project, image_sha256)
+            if self.upload_index is not None
+            else None
+        )
+        if known is not None:
+            result["image_id"] = known.image_id
+            result["deduplicated"] = True
+            if annotation is None or known.annotation_sha256 == annotation_sha256:
+                result["status"] = "skipped"
+                return result
+
+        # One key per request for the life of this item: the client retries
+        # transient failures itself (under its retry policy and budget,
+        # logging rf_request_retry/rf_request_recovered) and the server
+        # collapses the repeats into a single image/annotation.
+        name = PurePosixPath(item.image).name
+        try:
+            if "image_id" not in result:
+                response = self.client.upload_image(
+                    project,
+                    name,
+                    image,
+                    split=item.split,
+                    idempotency_key=uuid.uuid4().hex,
+                )
+                result["image_id"] = response.get("id")
+                self._index_image(workspace, project, image_sha256, result, None)
+            if annotation is not None and result["image_id"]:
+                self.client.upload_annotation(
+                    project,
+                    result["image_id"],
+                    PurePosixPath(item.annotation).name,
+                    annotation,
+                    idempotency_key=uuid.uuid4().hex,
+                )
+                self._index_image(workspace, project, image_sha256, result, annotation_sha256)
+            result["status"] = "success"
+            return result
+        except RoboflowAPIError as exc:
+            result["retries"] = exc.retries
+            result["error"] = str(exc)
+
+        result["status"] = "error"
+        log_event(
+            self.logger,
+            "dataset_image_failed",
+            image=item.image,
+            retries=result["retries"],
+            error=result["error"],
+        )
+        return result
+
+    def _index_image(
+        self,
+        workspace: str,
+        project: str,
+        sha256: str,
+        result: Dict[str, Any],
+        annotation_sha256: Optional[str],
+    ) -> None:
+        if self.upload_index is None:
+            return
+        self.upload_index.record(
+            workspace,
+            project,
+            sha256,
+            size_bytes=result["size_bytes"],
+            image_id=result["image_id"],
+            annotation_sha256=annotation_sha256,
+            name=result["image"],
+        )
+
 
 def validate_model_extension(path: Path) -> bool:
     """Return True if file extension matches accepted model artifacts."""
@@ -2,18 +2,30 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from .config import APP_VERSION
 
 
+_last_timestamp = datetime.min.replace(tzinfo=timezone.utc)
+_timestamp_lock = threading.Lock()
+
+
 def generate_operation_id(prefix: str = "upl") -> str:
-    """Generate a sortable operation identifier."""
+    """Generate a sortable operation identifier.
+
+    Identifiers carry microseconds and are strictly increasing within the
+    process, so concurrent operations never share a manifest file.
+    """
 
-    ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-    return f"{prefix}-{ts}"
+    global _last_timestamp
+    with _timestamp_lock:
+        now = max(datetime.now(timezone.utc), _last_timestamp + timedelta(microseconds=1))
+        _last_timestamp = now
+    return f"{prefix}-{now.strftime('%Y%m%d-%H%M%S-%f')}"
 
 
 def write_manifest(manifests_dir: Path, operation_id: str, payload: Dict[str, Any]) -> Path:
@@ -29,3 +41,13 @@ def write_manifest(manifests_dir: Path, operation_id: str, payload: Dict[str, An
     }
     manifest_path.write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding="utf-8")
     return manifest_path
+
+
+def iter_manifests(manifests_dir: Path, prefix: str = "") -> Iterator[Dict[str, Any]]:
+    """Yield manifests whose operation id starts with ``prefix``, newest first."""
+
+    for path in sorted(manifests_dir.glob(f"{prefix}*.json"), reverse=True):
+        try:
+            yield json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
@@ -26,26 +26,39 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from app.core.cache import HierarchyDiskCache
 from app.core.config import APP_NAME, load_config, mask_secret
+from app.core.hash_cache import HashCache
+from app.core.log_rotation import DEFAULT_ROTATION
 from app.core.logging_util import log_event, setup_logging
-from app.core.roboflow_client import RoboflowAPIError, RoboflowClient
+from app.core.roboflow_client import HierarchyResult, RoboflowAPIError, RoboflowClient
+from app.core.upload_index import UploadIndex
 from app.core.uploader import UploadManager, validate_model_extension
 
 
 class WorkerSignals(QObject):
     finished = Signal(object)
     error = Signal(Exception)
+    progress = Signal(object, object)
 
 
 class FunctionWorker(QRunnable):
-    """Run blocking functions on a background thread."""
+    """Run blocking functions on a background thread.
 
-    def __init__(self, fn: Callable, *args: Any, **kwargs: Any) -> None:
+    With ``report_progress=True`` the function receives a
+    ``progress_callback(done, total)`` that emits ``signals.progress``.
+    """
+
+    def __init__(
+        self, fn: Callable, *args: Any, report_progress: bool = False, **kwargs: Any
+    ) -> None:
         super().__init__()
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
         self.signals = WorkerSignals()
+        if report_progress:
+            self.kwargs["progress_callback"] = self.signals.progress.emit
 
     def run(self) -> None:  # noqa: D401 - QRunnable interface
         try:
@@ -65,13 +78,21 @@ class MainWindow(QMainWindow):
         self.thread_pool = QThreadPool.globalInstance()
 
         self.config = load_config()
-        self.logger = setup_logging(self.config.logs_dir)
-        self.client = RoboflowClient(self.config.api_key)
+        self.logger = setup_logging(
+            self.config.logs_dir, use_queue=True, rotation=DEFAULT_ROTATION
+        )
+        self.client = RoboflowClient(
+            self.config.api_key,
+            disk_cache=HierarchyDiskCache(self.config.cache_dir, self.config.api_key),
+            base_url=self.config.api_base_url,
+        )
         self.uploader = UploadManager(
             self.client,
             artifacts_dir=self.config.artifacts_dir,
             manifests_dir=self.config.manifests_dir,
             logger=self.logger,
+            upload_index=UploadIndex(self.config.cache_dir / "upload_index.sqlite3"),
+            hash_cache=HashCache(self.config.cache_dir / "hash_cache.sqlite3"),
         )
 
         self.selected_file: Optional[Path] = None
@@ -96,7 +117,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(api_key_label)
 
         refresh_button = QPushButton("Workspace/Project/Version listesini yenile")
-        refresh_button.clicked.connect(self.refresh_hierarchy)
+        refresh_button.clicked.connect(lambda: self.refresh_hierarchy(force=True))
         layout.addWidget(refresh_button)
 
         self.tree = QTreeWidget()
@@ -130,6 +151,9 @@ class MainWindow(QMainWindow):
         self.train_checkbox = QCheckBox("Yükleme sonrası training tetikle")
         mode_layout.addRow(self.train_checkbox)
 
+        self.per_image_checkbox = QCheckBox("Görselleri zip içinden paralel tek tek yükle")
+        mode_layout.addRow(self.per_image_checkbox)
+
         self.storage_note_input = QLineEdit()
         self.storage_note_input.setPlaceholderText("Artefakt depolama notu (örn. S3 URL)")
         mode_layout.addRow("Depolama notu", self.storage_note_input)
@@ -207,7 +231,12 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
     # Data loading
     # ------------------------------------------------------------------
-    def refresh_hierarchy(self) -> None:
+    def refresh_hierarchy(self, *, force: bool = False) -> None:
+        """Show the cached tree immediately, then revalidate it in the background.
+
+        ``force`` bypasses the cache TTLs so every node is revalidated.
+        """
+
         if not self.config.api_key:
             QMessageBox.warning(
                 self,
@@ -216,30 +245,44 @@ class MainWindow(QMainWindow):
             )
             return
 
-        worker = FunctionWorker(self._load_hierarchy)
+        cached = self.client.cached_hierarchy()
+        if cached is not None:
+            self._render_tree(cached)
+
+        worker = FunctionWorker(self._load_hierarchy, force)
         worker.signals.finished.connect(self._populate_tree)
         worker.signals.error.connect(self._handle_refresh_error)
-        self._start_worker(worker, busy_message="Projeler alınıyor…")
+        self._start_worker(
+            worker,
+            busy_message="Önbellekten gösteriliyor, yenileniyor…" if cached else "Projeler alınıyor…",
+        )
 
-    def _load_hierarchy(self) -> dict[str, dict[str, list]]:
-        hierarchy: dict[str, dict[str, list]] = {}
-        for workspace in self.client.list_workspaces():
-            workspace_slug = workspace.get("id") or workspace.get("slug")
-            if not workspace_slug:
-                continue
-            hierarchy[workspace_slug] = {}
-            for project in self.client.list_projects(workspace_slug):
-                project_slug = project.get("name") or project.get("slug") or project.get("id")
-                if not project_slug:
-                    continue
-                versions = self.client.list_versions(workspace_slug, project_slug)
-                hierarchy[workspace_slug][project_slug] = versions
-        return hierarchy
-
-    def _populate_tree(self, data: Dict[str, Dict[str, list]]) -> None:
+    def _load_hierarchy(self, force: bool = False) -> HierarchyResult:
+        return self.client.fetch_hierarchy(refresh=force)
+
+    def _populate_tree(self, result: HierarchyResult) -> None:
         self.progress.hide()
+        self._render_tree(result)
+        if result.errors:
+            for error in result.errors:
+                log_event(
+                    self.logger,
+                    "ui_hierarchy_node_failed",
+                    workspace=error.workspace,
+                    project=error.project,
+                    status_code=error.status_code,
+                    error=error.message,
+                )
+            self.statusBar().showMessage(
+                f"Liste güncellendi ({len(result.errors)} öğe alınamadı)"
+            )
+        else:
+            self.statusBar().showMessage("Liste güncellendi")
+
+    def _render_tree(self, result: HierarchyResult) -> None:
+        selection = (self.selected_workspace, self.selected_project, self.selected_version)
         self.tree.clear()
-        for workspace, projects in data.items():
+        for workspace, projects in result.hierarchy.items():
             workspace_item = QTreeWidgetItem([workspace, "Workspace", ""])
             workspace_item.setData(0, Qt.UserRole, "workspace")
             workspace_item.setData(0, Qt.UserRole + 1, workspace)
@@ -260,7 +303,27 @@ class MainWindow(QMainWindow):
                     version_item.setData(0, Qt.UserRole + 3, str(version_name))
                     project_item.addChild(version_item)
         self.tree.expandAll()
-        self.statusBar().showMessage("Liste güncellendi")
+        self._restore_selection(*selection)
+
+    def _restore_selection(
+        self, workspace: Optional[str], project: Optional[str], version: Optional[str]
+    ) -> None:
+        if not workspace:
+            return
+        for i in range(self.tree.topLevelItemCount()):
+            item = self.tree.topLevelItem(i)
+            if item.data(0, Qt.UserRole + 1) != workspace:
+                continue
+            for role, wanted in ((Qt.UserRole + 2, project), (Qt.UserRole + 3, version)):
+                if not wanted:
+                    break
+                children = (item.child(j) for j in range(item.childCount()))
+                match = next((c for c in children if c.data(0, role) == wanted), None)
+                if match is None:
+                    break
+                item = match
+            self.tree.setCurrentItem(item)
+            return
 
     def _handle_refresh_error(self, error: Exception) -> None:
         self.progress.hide()
@@ -309,14 +372,25 @@ class MainWindow(QMainWindow):
                     "A Modu için sıkıştırılmış (.zip) dataset arşivi seçmelisiniz.",
                 )
                 return
-            worker = FunctionWorker(
-                self.uploader.upload_dataset,
-                workspace=self.selected_workspace,
-                project=self.selected_project,
-                dataset_zip_path=self.selected_file,
-                trigger_training=self.train_checkbox.isChecked(),
-                description=self.dataset_description.text(),
-            )
+            if self.per_image_checkbox.isChecked():
+                worker = FunctionWorker(
+                    self.uploader.upload_dataset_images,
+                    workspace=self.selected_workspace,
+                    project=self.selected_project,
+                    dataset_zip_path=self.selected_file,
+                    report_progress=True,
+                )
+            else:
+                worker = FunctionWorker(
+                    self.uploader.upload_dataset,
+                    workspace=self.selected_workspace,
+                    project=self.selected_project,
+                    dataset_zip_path=self.selected_file,
+                    trigger_training=self.train_checkbox.isChecked(),
+                    description=self.dataset_description.text(),
+                    report_progress=True,
+                )
+            worker.signals.progress.connect(self._update_progress)
 
         worker.signals.finished.connect(self._handle_execution_success)
         worker.signals.error.connect(self._handle_execution_error)
@@ -340,11 +414,26 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
     # Worker helper
     # ------------------------------------------------------------------
+    def _update_progress(self, done: int, total: int) -> None:
+        if total:
+            self.progress.setRange(0, 1000)
+            self.progress.setValue(int(done * 1000 / total))
+
     def _start_worker(self, worker: FunctionWorker, *, busy_message: str) -> None:
+        self.progress.setRange(0, 0)
         self.progress.show()
         self.statusBar().showMessage(busy_message)
         self.thread_pool.start(worker)
 
+    def closeEvent(self, event) -> None:  # noqa: N802 - Qt API
+        self.thread_pool.waitForDone()
+        self.client.close()
+        if self.uploader.upload_index is not None:
+            self.uploader.upload_index.close()
+        if self.uploader.hash_cache is not None:
+            self.uploader.hash_cache.close()
+        super().closeEvent(event)
+
 
 def main() -> None:
     app = QApplication(sys.argv)
@@ -0,0 +1,73 @@
+"""Measure structured event throughput of the logging pipeline.
+
+Usage: python scripts/bench_logging.py [--events N] [--threads T] [--queue] [--overflow P]
+
+Events are written to a temporary logs directory through the same
+``setup_logging``/``log_event`` path the application uses.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.logging_util import log_event, setup_logging  # noqa: E402
+
+
+def run(logger: logging.Logger, events: int, threads: int) -> float:
+    per_thread = events // threads
+
+    def worker(index: int) -> None:
+        for i in range(per_thread):
+            log_event(
+                logger,
+                "rf_list_versions",
+                workspace="bench-workspace",
+                project=f"project-{index}",
+                count=i,
+                source="network",
+            )
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    for handler in logger.handlers:
+        handler.flush()
+    return per_thread * threads / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--queue", action="store_true", help="use the queue-based pipeline")
+    parser.add_argument("--overflow", default="block", choices=["block", "drop", "sample"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = setup_logging(Path(tmp), use_queue=args.queue, overflow=args.overflow)
+        rate = run(logger, args.events, args.threads)
+        for handler in logger.handlers:
+            listener = getattr(handler, "listener", None)
+            if listener is not None:
+                listener.stop()
+        lines = sum(1 for _ in (Path(tmp) / "events.jsonl").open(encoding="utf-8"))
+        logging.shutdown()
+    mode = f"queue/{args.overflow}" if args.queue else "sync"
+    print(
+        f"{mode}: {rate:,.0f} events/s "
+        f"({args.events:,} events, {args.threads} threads, {lines:,} lines)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from app.core.retry import RetryPolicy
+from app.core.roboflow_client import RoboflowClient
+from app.core.uploader import UploadManager
+from fake_server import FakeRoboflow
+
+
+@pytest.fixture
+def fake_roboflow() -> Iterator[FakeRoboflow]:
+    server = FakeRoboflow().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(fake_roboflow: FakeRoboflow) -> Iterator[RoboflowClient]:
+    # One attempt per request so an injected failure surfaces immediately.
+    with RoboflowClient(
+        "test-key",
+        base_url=fake_roboflow.url,
+        retry_policy=RetryPolicy(max_attempts=1),
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def manager(client: RoboflowClient, tmp_path: Path) -> UploadManager:
+    return UploadManager(
+        client,
+        artifacts_dir=tmp_path / "artifacts",
+        manifests_dir=tmp_path / "manifests",
+        logger=logging.getLogger("roboflow_uploader.tests"),
+        chunk_size=64 * 1024,
+        resumable_threshold=0,
+    )
@@ -0,0 +1,133 @@
+"""In-process stand-in for the Roboflow chunked upload endpoints.
+
+Only what :meth:`UploadManager.upload_dataset` needs for a resumable upload
+is implemented: opening a session, ``PUT``-ing chunks (checked against
+``X-Chunk-SHA256``) and completing the session. Sessions that are not known
+answer ``expired_status`` (``410 Gone`` by default), as an expired session
+would.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+_SESSIONS = re.compile(r"^/[^/]+/[^/]+/uploads$")
+_CHUNK = re.compile(r"^/[^/]+/[^/]+/uploads/([^/]+)/chunks/(\d+)$")
+_COMPLETE = re.compile(r"^/[^/]+/[^/]+/uploads/([^/]+)/complete$")
+
+
+class FakeRoboflow:
+    """Server state plus the HTTP server that exposes it on localhost.
+
+    ``fail_chunks`` maps a chunk index to a status code returned (once)
+    instead of storing that chunk. ``chunk_puts`` records ``(session_id,
+    index)`` for every stored chunk, in order.
+    """
+
+    def __init__(self) -> None:
+        self.sessions: Dict[str, Dict[int, bytes]] = {}
+        self.completed: Dict[str, bytes] = {}
+        self.chunk_puts: List[Tuple[str, int]] = []
+        self.fail_chunks: Dict[int, int] = {}
+        self.expired_status = 410
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None, "server not started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeRoboflow":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def expire_sessions(self) -> None:
+        with self._lock:
+            self.sessions.clear()
+
+    # Request handling -------------------------------------------------
+    def open_session(self) -> Tuple[int, Dict[str, Any]]:
+        with self._lock:
+            self._opened += 1
+            session_id = f"session-{self._opened}"
+            self.sessions[session_id] = {}
+        return 200, {"session_id": session_id}
+
+    def put_chunk(
+        self, session_id: str, index: int, data: bytes, sha256: str
+    ) -> Tuple[int, Dict[str, Any]]:
+        with self._lock:
+            if session_id not in self.sessions:
+                return self.expired_status, {"error": f"Upload session {session_id} expired"}
+            status = self.fail_chunks.pop(index, None)
+            if status is not None:
+                return status, {"error": f"Injected failure for chunk {index}"}
+            if hashlib.sha256(data).hexdigest() != sha256:
+                return 400, {"error": "Chunk checksum mismatch"}
+            self.sessions[session_id][index] = data
+            self.chunk_puts.append((session_id, index))
+        return 200, {"index": index, "received": len(data)}
+
+    def complete(self, session_id: str) -> Tuple[int, Dict[str, Any]]:
+        with self._lock:
+            chunks = self.sessions.pop(session_id, None)
+            if chunks is None:
+                return self.expired_status, {"error": f"Upload session {session_id} expired"}
+            self.completed[session_id] = b"".join(chunks[index] for index in sorted(chunks))
+            version = str(len(self.completed))
+        return 200, {"version": version}
+
+
+def _handler_for(fake: FakeRoboflow) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def _body(self) -> bytes:
+            return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            path = urlsplit(self.path).path
+            self._body()
+            if _SESSIONS.match(path):
+                return self._reply(*fake.open_session())
+            match = _COMPLETE.match(path)
+            if match:
+                return self._reply(*fake.complete(match.group(1)))
+            self._reply(404, {"error": f"No route for POST {path}"})
+
+        def do_PUT(self) -> None:  # noqa: N802 - http.server API
+            path = urlsplit(self.path).path
+            data = self._body()
+            match = _CHUNK.match(path)
+            if not match:
+                return self._reply(404, {"error": f"No route for PUT {path}"})
+            sha256 = self.headers.get("X-Chunk-SHA256", "")
+            self._reply(*fake.put_chunk(match.group(1), int(match.group(2)), data, sha256))
+
+    return Handler
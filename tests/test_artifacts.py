@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from app.core import artifacts
+from app.core.artifacts import (
+    HASH_ALGORITHM,
+    TREE_HASH_ALGORITHM,
+    ArtifactStore,
+    copy_and_hash,
+    hash_file,
+    tree_hash_file,
+)
+from app.core.hash_cache import HashCache
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "best.pt"
+    path.write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+    return path
+
+
+@pytest.mark.parametrize("algorithm", [HASH_ALGORITHM, TREE_HASH_ALGORITHM])
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_copy_and_hash_matches_the_standalone_digests(tmp_path, source, algorithm, kernel_copy):
+    strategy, digest = copy_and_hash(
+        source, tmp_path / "copy", algorithm=algorithm, kernel_copy=kernel_copy
+    )
+
+    expected = hash_file(source) if algorithm == HASH_ALGORITHM else tree_hash_file(source)
+    assert digest == expected
+    assert (tmp_path / "copy").read_bytes() == source.read_bytes()
+    if not kernel_copy:
+        assert strategy == "buffered"
+
+
+def test_tree_hash_stays_parallel_without_kernel_copies(tmp_path, source):
+    with mock.patch.object(artifacts.sys, "platform", "darwin"), mock.patch.object(
+        artifacts, "tree_hash_file", wraps=tree_hash_file
+    ) as parallel:
+        strategy, _ = copy_and_hash(source, tmp_path / "copy", algorithm=TREE_HASH_ALGORITHM)
+
+    assert strategy == "buffered"
+    parallel.assert_called_once_with(tmp_path / "copy")
+
+
+def test_relink_without_a_hash_cache_reports_the_discarded_copy(tmp_path, source):
+    store = ArtifactStore(tmp_path / "store")
+    first = store.put(source)
+    second = store.put(source)
+
+    assert first.strategy != "dedup"
+    assert second.strategy == "dedup_after_copy"
+    assert second.path == first.path
+    assert not list((tmp_path / "store").glob("*.tmp"))
+
+
+def test_relink_with_a_hash_cache_copies_nothing(tmp_path, source):
+    os.utime(source, (1_000_000_000, 1_000_000_000))  # outside the racy window
+    cache = HashCache(tmp_path / "hash_cache.sqlite3")
+    store = ArtifactStore(tmp_path / "store", hash_cache=cache)
+    store.put(source)
+
+    with mock.patch.object(artifacts, "_copy") as copy:
+        second = store.put(source)
+
+    copy.assert_not_called()
+    assert (second.strategy, second.hash_source) == ("dedup", "cache")
+    assert second.metadata()["seconds"] == 0
+    assert second.metadata()["throughput_mib_s"] is None
+    cache.close()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from app.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from app.core.retry import RetryPolicy
+from app.core.roboflow_client import CircuitOpenError, RoboflowClient
+
+
+def _client(breaker: CircuitBreaker) -> RoboflowClient:
+    return RoboflowClient(
+        "test-key",
+        base_url="http://127.0.0.1:9",
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breaker=breaker,
+    )
+
+
+def test_probe_raising_an_unexpected_error_does_not_wedge_the_breaker():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    with _client(breaker) as client:
+        session = client._get_session()
+        with mock.patch.object(session, "request", side_effect=OSError("stream reset")):
+            with pytest.raises(OSError):
+                client._request("GET", "/ws")
+        assert breaker.state == OPEN
+
+        ok = mock.Mock(status_code=200, ok=True)
+        with mock.patch.object(session, "request", return_value=ok) as request:
+            assert client._request("GET", "/ws") is ok
+        request.assert_called_once()
+    assert breaker.state == CLOSED
+
+
+def test_interrupted_probe_releases_its_reservation():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+
+    with _client(breaker) as client:
+        session = client._get_session()
+        with mock.patch.object(session, "request", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                client._request("GET", "/ws")
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_open_error_message_while_probe_is_in_flight():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.allow_request()
+
+    assert "probe request is in flight" in str(CircuitOpenError(breaker))
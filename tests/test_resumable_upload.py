@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from app.core.roboflow_client import RoboflowAPIError
+from app.core.upload_journal import UploadJournal
+from app.core.uploader import UploadManager
+from fake_server import FakeRoboflow
+
+CHUNK = 64 * 1024
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    """A stored (uncompressed) zip spanning four 64 KiB chunks."""
+
+    path = tmp_path / "dataset.zip"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("train/images/a.jpg", os.urandom(120 * 1024))
+        zf.writestr("train/labels/a.txt", b"0 0.5 0.5 0.2 0.2\n")
+        zf.writestr("valid/images/b.jpg", os.urandom(100 * 1024))
+    assert 3 * CHUNK < path.stat().st_size <= 4 * CHUNK
+    return path
+
+
+def _upload(manager: UploadManager, archive: Path) -> dict:
+    return manager.upload_dataset(workspace="ws", project="proj", dataset_zip_path=archive)
+
+
+def _fail_once(manager: UploadManager, archive: Path, fake: FakeRoboflow) -> UploadJournal:
+    fake.fail_chunks[2] = 503
+    with pytest.raises(RoboflowAPIError) as excinfo:
+        _upload(manager, archive)
+    assert excinfo.value.status_code == 503
+    journal = UploadJournal.find_resumable(
+        manager.manifests_dir, workspace="ws", project="proj", archive=archive
+    )
+    assert journal is not None
+    return journal
+
+
+def test_failed_upload_leaves_a_journal_of_acknowledged_chunks(manager, archive, fake_roboflow):
+    journal = _fail_once(manager, archive, fake_roboflow)
+
+    assert sorted(journal.chunks) == [0, 1]
+    assert [chunk["length"] for chunk in journal.chunks.values()] == [CHUNK, CHUNK]
+    assert not journal.completed
+    assert journal.path.read_text(encoding="utf-8").count("\n") == 3  # header + 2 chunks
+
+
+def test_resume_skips_acknowledged_chunks(manager, archive, fake_roboflow):
+    journal = _fail_once(manager, archive, fake_roboflow)
+    session_id = journal.session_id
+    sent_before = len(fake_roboflow.chunk_puts)
+
+    result = _upload(manager, archive)
+
+    assert result["operation_id"] == journal.operation_id
+    assert result["api_response"] == {"version": "1"}
+    assert fake_roboflow.chunk_puts[sent_before:] == [(session_id, 2), (session_id, 3)]
+    assert fake_roboflow.completed[session_id] == archive.read_bytes()
+    assert UploadJournal.load(journal.path).completed
+    assert (
+        UploadJournal.find_resumable(
+            manager.manifests_dir, workspace="ws", project="proj", archive=archive
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize("status", [404, 410])
+def test_expired_session_restarts_from_the_first_chunk(manager, archive, fake_roboflow, status):
+    journal = _fail_once(manager, archive, fake_roboflow)
+    fake_roboflow.expire_sessions()
+    fake_roboflow.expired_status = status
+    sent_before = len(fake_roboflow.chunk_puts)
+
+    result = _upload(manager, archive)
+
+    resent = fake_roboflow.chunk_puts[sent_before:]
+    new_session = resent[0][0]
+    assert new_session != journal.session_id
+    assert resent == [(new_session, index) for index in range(4)]
+    assert fake_roboflow.completed[new_session] == archive.read_bytes()
+    assert result["operation_id"] == journal.operation_id
+
+
+def test_changed_archive_is_not_resumed(manager, archive, fake_roboflow):
+    _fail_once(manager, archive, fake_roboflow)
+    with zipfile.ZipFile(archive, "a") as zf:
+        zf.writestr("test/images/c.jpg", os.urandom(1024))
+
+    assert (
+        UploadJournal.find_resumable(
+            manager.manifests_dir, workspace="ws", project="proj", archive=archive
+        )
+        is None
+    )
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from app.core.cache import ResponseCache
+from app.core.roboflow_client import RoboflowClient
+
+
+def _response(payload):
+    return mock.Mock(status_code=200, ok=True, content=b"{}", json=mock.Mock(return_value=payload))
+
+
+def test_note_append_drops_the_project_version_listing():
+    client = RoboflowClient("test-key", base_url="http://127.0.0.1:9")
+    versions_key = ResponseCache.make_key("/ws/proj")
+    projects_key = ResponseCache.make_key("/ws")
+    client.response_cache.put(versions_key, [{"id": "1"}])
+    client.response_cache.put(projects_key, [{"id": "proj"}])
+
+    with mock.patch.object(client._get_session(), "request", return_value=_response({})):
+        client.append_version_note("ws", "proj", "1", "note")
+
+    assert client.response_cache.get(versions_key) is None
+    assert client.response_cache.get(projects_key) == [{"id": "proj"}]
+    client.close()
+
+
+def test_fetch_hierarchy_records_a_non_json_node_and_keeps_crawling():
+    client = RoboflowClient("test-key", base_url="http://127.0.0.1:9")
+    bodies = {
+        "/": {"workspaces": [{"id": "ws"}]},
+        "/ws": {"projects": [{"name": "good"}, {"name": "broken"}]},
+        "/ws/good": {"versions": [{"id": "1"}]},
+    }
+
+    def respond(method, url, **kwargs):
+        path = url[len(client.base_url):] or "/"
+        if path not in bodies:
+            broken = mock.Mock(status_code=200, ok=True, headers={})
+            broken.json.side_effect = ValueError("Expecting value: line 1 column 1 (char 0)")
+            return broken
+        return mock.Mock(status_code=200, ok=True, headers={}, json=mock.Mock(return_value=bodies[path]))
+
+    with mock.patch.object(client._get_session(), "request", side_effect=respond):
+        result = client.fetch_hierarchy()
+
+    assert list(result.hierarchy["ws"]) == ["good", "broken"]
+    assert result.hierarchy["ws"]["broken"] == []
+    assert len(result.hierarchy["ws"]["good"]) == 1
+    assert [(error.project, error.status_code) for error in result.errors] == [("broken", 200)]
+    client.close()